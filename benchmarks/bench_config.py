@@ -0,0 +1,37 @@
+"""Converting structured jobs directly versus rebuilding argv and parsing it. """
+
+import time as _time
+
+import lib_dzne_auto_interface as _lib
+import lib_dzne_auto_interface.Config as _Config
+
+
+def _function(source, /, *values:float, alpha:int=0, mode:{'choices':['a', 'b']}='a'):
+    return source
+
+
+def run(size=10_000):
+    knot = _lib.make(_function, return_details={})
+    jobs = [
+        {'source': f"s{i}", 'values': [0.5, 1.5, 2.5], 'alpha': i, 'mode': 'b'}
+        for i in range(size)
+    ]
+    t = _time.perf_counter()
+    for job in jobs:
+        argv = [job['source'], *map(str, job['values']), '-alpha', str(job['alpha']), '-mode', job['mode']]
+        knot.parse(argv)
+    argv = _time.perf_counter() - t
+    t = _time.perf_counter()
+    for job in jobs:
+        _Config.convert(knot, job)
+    direct = _time.perf_counter() - t
+    return {f'config{size}_argv': argv, f'config{size}_direct': direct}
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
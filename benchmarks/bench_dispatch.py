@@ -0,0 +1,50 @@
+"""Overhead of run_dictionary over a direct call. """
+
+import time as _time
+
+import lib_dzne_auto_interface as _lib
+
+
+def _varargs(*items, flag:int=0):
+    return len(items)
+
+def _many_parameters(size):
+    names = [f"p{i}" for i in range(size)]
+    namespace = dict()
+    exec(f"def function({', '.join(names)}, /):\n    return None", namespace)
+    return namespace['function'], names
+
+
+def _timeit(func, *, repeat=5):
+    ans = float('inf')
+    for i in range(repeat):
+        t = _time.perf_counter()
+        func()
+        ans = min(ans, _time.perf_counter() - t)
+    return ans
+
+
+def run(sizes=(1_000, 10_000, 100_000)):
+    ans = dict()
+    knot = _lib.make(_varargs, return_details={})
+    for size in sizes:
+        items = [object()] * size
+        dictionary = {'items': items, 'flag': 1}
+        direct = _timeit(lambda: _varargs(*items, flag=1))
+        wrapped = _timeit(lambda: knot.run_dictionary(dictionary))
+        ans[f'dispatch_varargs{size}_overhead'] = wrapped - direct
+    for size in (100, 1_000):
+        function, names = _many_parameters(size)
+        knot = _lib.make(function, return_details={})
+        dictionary = dict.fromkeys(names)
+        ans[f'dispatch_parameters{size}'] = _timeit(lambda: knot.run_dictionary(dictionary))
+    return ans
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
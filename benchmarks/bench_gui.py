@@ -0,0 +1,92 @@
+"""Headless construction time of the GUI frames; needs Xvfb. """
+
+import contextlib as _ctx
+import json as _json
+import os as _os
+import shutil as _shutil
+import subprocess as _sp
+import sys as _sys
+import time as _time
+
+_SNIPPET = """
+import json, sys, time, tkinter, types
+import lib_dzne_auto_interface as lib
+names = [f"p{i}" for i in range(50)]
+namespace = dict()
+exec(f"def wide({', '.join(names)}, /, *, flag:int=0):\\n    return None", namespace)
+def command(x, /, *, y:int=0):
+    "Example. "
+    return x
+tree = types.SimpleNamespace(_dest='command', **{f"command_{i}": command for i in range(200)})
+root = tkinter.Tk()
+ans = dict()
+for name, value in [('gui_callable50', namespace['wide']), ('gui_uncallable200', tree)]:
+    t = time.perf_counter()
+    frame = lib.make(value, return_details={}).frame(root)
+    frame.pack()
+    root.update_idletasks()
+    ans[name] = time.perf_counter() - t
+    frame.destroy()
+def many(x:{'nargs':500}, /):
+    return x
+frame = lib.make(many, return_details={}).frame(root)
+frame.pack()
+root.update_idletasks()
+t = time.perf_counter()
+frame.parse()
+ans['gui_nargs500_parse'] = time.perf_counter() - t
+frame.destroy()
+root.destroy()
+print(json.dumps(ans))
+"""
+
+
+def _free_display():
+    for number in range(99, 200):
+        if not _os.path.exists(f"/tmp/.X{number}-lock"):
+            return f":{number}"
+    raise RuntimeError("No free X display number was found. ")
+
+
+@_ctx.contextmanager
+def xvfb():
+    """Run an Xvfb server and yield its display, e.g. ':99'. """
+    display = _free_display()
+    server = _sp.Popen(
+        ['Xvfb', display, '-screen', '0', '1280x1024x24'],
+        stdout=_sp.DEVNULL,
+        stderr=_sp.DEVNULL,
+    )
+    try:
+        _time.sleep(1)
+        yield display
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run():
+    """Returns an empty dict if Xvfb is not installed. """
+    if _shutil.which('Xvfb') is None:
+        return {}
+    with xvfb() as display:
+        out = _sp.run(
+            [_sys.executable, '-c', _SNIPPET],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=dict(_os.environ, DISPLAY=display),
+        ).stdout
+    return _json.loads(out)
+
+
+def main():
+    ans = run()
+    if not ans:
+        print("skipped: Xvfb is not installed")
+    for key, value in ans.items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
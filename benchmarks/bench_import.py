@@ -0,0 +1,42 @@
+"""Startup time of the CLI path; fails if tkinter gets imported. """
+
+import statistics as _stat
+import subprocess as _sp
+import sys as _sys
+
+_SNIPPET = """
+import sys, time
+t = time.perf_counter()
+import lib_dzne_auto_interface as lib
+def f(x, /, *, y:int=0):
+    "Example. "
+    return x
+lib.make(f, return_details={}).parse(['a', '-y', '1'])
+t = time.perf_counter() - t
+print(t, 'tkinter' in sys.modules)
+"""
+
+
+def run(*, repeat=10):
+    times = list()
+    for i in range(repeat):
+        out = _sp.run(
+            [_sys.executable, '-c', _SNIPPET],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        t, loaded = out.split()
+        if loaded != 'False':
+            raise AssertionError("The CLI path imported tkinter. ")
+        times.append(float(t))
+    return {'import_and_parse': _stat.median(times)}
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
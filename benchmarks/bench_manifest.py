@@ -0,0 +1,65 @@
+"""Cold (introspection) against warm (manifest cache) startup. """
+
+import importlib as _il
+import os as _os
+import sys as _sys
+import tempfile as _tmp
+import time as _time
+
+import lib_dzne_auto_interface as _lib
+
+_COMMAND = '''
+def command_{i}(x, /, *ys, alpha:int=0, beta:float=1.0, gamma:str="", delta=None):
+    "Command number {i}. "
+    return x
+'''
+
+
+def _write_module(directory, size):
+    name = f"_bench_manifest_{size}"
+    with open(_os.path.join(directory, name + '.py'), 'w') as stream:
+        stream.write("_dest = 'command'\n")
+        for i in range(size):
+            stream.write(_COMMAND.format(i=i))
+    return name
+
+
+def _timeit(func, *, repeat=5):
+    ans = float('inf')
+    for i in range(repeat):
+        t = _time.perf_counter()
+        func()
+        ans = min(ans, _time.perf_counter() - t)
+    return ans
+
+
+def run(size=1000):
+    with _tmp.TemporaryDirectory() as directory:
+        _sys.path.insert(0, directory)
+        try:
+            module = _il.import_module(_write_module(directory, size))
+            cache = _os.path.join(directory, 'cache')
+            # every command has a manifest of its own
+            _lib.make(module, return_details={}, cache=cache).mains
+            ans = dict()
+            for key, kwargs in [('cold', {}), ('warm', {'cache': cache})]:
+                def leaf():
+                    knot = _lib.make(module, return_details={}, **kwargs)
+                    knot.parse(['command-7', 'a', '-alpha', '3'])
+                def full():
+                    knot = _lib.make(module, return_details={}, **kwargs)
+                    knot.mains
+                ans[f'manifest{size}_{key}_leaf'] = _timeit(leaf)
+                ans[f'manifest{size}_{key}_full'] = _timeit(full, repeat=1)
+            return ans
+        finally:
+            _sys.path.remove(directory)
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Memory held by interfaces with thousands of arguments. """
+
+import gc as _gc
+import time as _time
+import tracemalloc as _tm
+
+import lib_dzne_auto_interface as _lib
+
+
+def synthetic_function(size=5000):
+    def function(**kwargs):
+        "Many options. "
+        return kwargs
+    function.__annotations__['kwargs'] = {
+        f"option_{i}": {
+            'option_strings': [f"--option-{i}"],
+            'type': int,
+            'default': i,
+            'help': f"Option number {i}. ",
+        } for i in range(size)
+    }
+    return function
+
+
+def run(size=5000):
+    function = synthetic_function(size)
+    _gc.collect()
+    _tm.start()
+    t = _time.perf_counter()
+    knot = _lib.make(function, return_details={})
+    t = _time.perf_counter() - t
+    current, peak = _tm.get_traced_memory()
+    _tm.stop()
+    return {
+        f'memory{size}_make_seconds': t,
+        f'memory{size}_held_bytes': current,
+        f'memory{size}_peak_bytes': peak,
+    }
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""Throughput of parsing argument vectors with a built knot. """
+
+import time as _time
+
+import lib_dzne_auto_interface as _lib
+
+
+def _function(source, /, *extras, alpha:int=0, beta:float=1.0, gamma:str="", flag:{'action':'store_true'}=False):
+    "Example. "
+    return source
+
+
+def run(size=10_000):
+    knot = _lib.make(_function, return_details={})
+    argvs = [
+        [f"source_{i}", "x", "y", "-alpha", str(i), "-beta", "0.5", "-flag"]
+        for i in range(size)
+    ]
+    knot.parse(argvs[0])
+    t = _time.perf_counter()
+    knot.parse_many(argvs)
+    t = _time.perf_counter() - t
+    return {f'parse{size}': t}
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
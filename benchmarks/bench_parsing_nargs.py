@@ -0,0 +1,37 @@
+"""Tokenizing large pastes into NargsPluralInput. """
+
+import time as _time
+
+import lib_dzne_auto_interface.gui.inputs._parsing_nargs as _parsing
+
+
+def synthetic_text(size=50_000):
+    """Roughly 3 MB of file paths, every third one quoted. """
+    lines = list()
+    for i in range(size):
+        path = f"/data/project/run_{i:06d}/sample {i % 97}/reads_{i}.fastq.gz"
+        if i % 3:
+            path = path.replace(' ', '_')
+        else:
+            path = '"' + path + '"'
+        lines.append(path)
+    return '\n'.join(lines)
+
+
+def run(size=50_000):
+    text = synthetic_text(size)
+    t = _time.perf_counter()
+    ans = _parsing.parse(text)
+    t = _time.perf_counter() - t
+    if len(ans) != size:
+        raise AssertionError
+    return {f'parsing_nargs_{len(text) // 1_000_000}MB': t}
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
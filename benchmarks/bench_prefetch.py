@@ -0,0 +1,68 @@
+"""Calls that load many File-typed arguments, with and without prefetching. 
+
+The slow variant adds a fixed latency to every read, 
+as a network share would. """
+
+import os as _os
+import tempfile as _tmp
+import time as _time
+
+import lib_dzne_filedata as _fd
+
+import lib_dzne_auto_interface as _lib
+
+
+class _SlowTXTData(_fd.TXTData):
+    latency = 0.002
+    @classmethod
+    def _load(cls, /, file):
+        _time.sleep(cls.latency)
+        return super()._load(file)
+
+
+def _local(*files:_fd.TXTData.File):
+    return sum(len(x.load()) for x in files)
+
+def _slow(*files:_SlowTXTData.File):
+    return sum(len(x.load()) for x in files)
+
+
+def _timeit(func, *, repeat=3):
+    ans = float('inf')
+    for i in range(repeat):
+        t = _time.perf_counter()
+        func()
+        ans = min(ans, _time.perf_counter() - t)
+    return ans
+
+
+def run(size=200, lines=200, workers=8):
+    ans = dict()
+    with _tmp.TemporaryDirectory() as directory:
+        argv = list()
+        for i in range(size):
+            file = _os.path.join(directory, f"{i}.txt")
+            with open(file, 'w') as s:
+                s.write("".join(f"line {j}\n" for j in range(lines)))
+            argv.append(file)
+        default = _lib.prefetch_workers
+        try:
+            for name, function in [('local', _local), ('slow', _slow)]:
+                knot = _lib.make(function, return_details={})
+                for n in (0, workers):
+                    _lib.prefetch_workers = n
+                    ans[f'prefetch_{name}{size}_workers{n}'] = _timeit(
+                        lambda: knot.run_dictionary(knot.parse(argv))
+                    )
+        finally:
+            _lib.prefetch_workers = default
+    return ans
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Startup and dispatch cost of large flat and nested command trees. """
+
+import time as _time
+import types as _types
+
+import lib_dzne_auto_interface as _lib
+
+
+def _command(i):
+    def command(x, /, *, alpha:int=0, beta:float=1.0, gamma:str="", delta=None):
+        return x
+    command.__doc__ = f"Command number {i}. "
+    return command
+
+
+def synthetic_tree(size=1000):
+    """A flat namespace of size commands. """
+    commands = {f"command_{i}": _command(i) for i in range(size)}
+    return _types.SimpleNamespace(_dest='command', **commands)
+
+
+def nested_tree(*, depth, width, prefix=""):
+    """width**depth commands in groups nested depth levels deep. """
+    if depth == 1:
+        members = {f"command_{i}": _command(f"{prefix}{i}") for i in range(width)}
+    else:
+        members = {
+            f"group_{i}": nested_tree(depth=depth - 1, width=width, prefix=f"{prefix}{i}.")
+            for i in range(width)
+        }
+    return _types.SimpleNamespace(_dest=f"level_{depth}", **members)
+
+
+def _timeit(func, *, repeat=5):
+    ans = float('inf')
+    for i in range(repeat):
+        t = _time.perf_counter()
+        func()
+        ans = min(ans, _time.perf_counter() - t)
+    return ans
+
+
+def _measure(name, tree, argv):
+    def leaf():
+        knot = _lib.make(tree, return_details={})
+        knot.parse(argv, add_help=True)
+    def full():
+        knot = _lib.make(tree, return_details={})
+        knot.parser(add_help=True)
+    knot = _lib.make(tree, return_details={})
+    dictionary = knot.parse(argv, add_help=True)
+    def dispatch():
+        for i in range(1000):
+            knot.parse(argv, add_help=True)
+            knot.run_dictionary(dictionary)
+    return {
+        f'{name}_leaf': _timeit(leaf),
+        f'{name}_full': _timeit(full, repeat=1),
+        f'{name}_dispatch1000': _timeit(dispatch),
+    }
+
+
+def run(size=1000):
+    ans = dict()
+    ans.update(_measure(
+        f'tree{size}',
+        synthetic_tree(size),
+        ['command-7', 'a', '-alpha', '3'],
+    ))
+    ans.update(_measure(
+        'tree10x10x10',
+        nested_tree(depth=3, width=10),
+        ['group-1', 'group-2', 'command-7', 'a', '-alpha', '3'],
+    ))
+    ans.update(_measure(
+        'tree4x4x4x4x4',
+        nested_tree(depth=5, width=4),
+        ['group-1', 'group-2', 'group-3', 'group-0', 'command-3', 'a', '-alpha', '3'],
+    ))
+    return ans
+
+
+def main():
+    for key, value in run().items():
+        print(f"{key}: {value * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
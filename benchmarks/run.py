@@ -0,0 +1,103 @@
+"""Runs the bench_*.py scripts and writes their results as JSON.
+
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py -o results.json --compare baseline.json
+
+All values are lower-is-better (seconds, bytes).  With --compare the
+exit status is 1 if any value grew by more than --tolerance. """
+
+import argparse as _argparse
+import importlib as _importlib
+import json as _json
+import os as _os
+import platform as _platform
+import sys as _sys
+import time as _time
+
+_DIRECTORY = _os.path.dirname(_os.path.abspath(__file__))
+
+
+def names():
+    ans = list()
+    for filename in sorted(_os.listdir(_DIRECTORY)):
+        if filename.startswith('bench_') and filename.endswith('.py'):
+            ans.append(filename[len('bench_'):-len('.py')])
+    return ans
+
+
+def run(selected=None):
+    if _DIRECTORY not in _sys.path:
+        _sys.path.insert(0, _DIRECTORY)
+    results = dict()
+    skipped = list()
+    for name in names():
+        if selected is not None and name not in selected:
+            continue
+        module = _importlib.import_module(f"bench_{name}")
+        ans = module.run()
+        if not ans:
+            skipped.append(name)
+        for key, value in ans.items():
+            results[f"{name}.{key}"] = value
+    return {
+        'meta': {
+            'python': _platform.python_version(),
+            'platform': _platform.platform(),
+            'time': _time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(results, baseline, *, tolerance):
+    """Returns the rows (key, old, new, ratio) and whether any regressed. """
+    rows = list()
+    regressed = False
+    for key in sorted(set(results) | set(baseline)):
+        old = baseline.get(key)
+        new = results.get(key)
+        if old is None or new is None or old <= 0:
+            ratio = None
+        else:
+            ratio = new / old
+            regressed |= ratio > 1 + tolerance
+        rows.append((key, old, new, ratio))
+    return rows, regressed
+
+
+def _format(value):
+    if value is None:
+        return '-'
+    return f"{value:.6g}"
+
+
+def main(args=None):
+    parser = _argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-o', '--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', metavar='BASELINE', help="compare against this JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed relative growth (default 0.2)")
+    parser.add_argument('--only', nargs='+', choices=names(), help="run only these benchmarks")
+    ns = parser.parse_args(args)
+    report = run(ns.only)
+    if ns.output is not None:
+        with open(ns.output, 'w') as s:
+            _json.dump(report, s, indent=2, sort_keys=True)
+            s.write('\n')
+    for name in report['skipped']:
+        print(f"skipped: {name}")
+    if ns.compare is None:
+        for key, value in sorted(report['results'].items()):
+            print(f"{key}: {_format(value)}")
+        return 0
+    with open(ns.compare, 'r') as s:
+        baseline = _json.load(s)['results']
+    rows, regressed = compare(report['results'], baseline, tolerance=ns.tolerance)
+    for key, old, new, ratio in rows:
+        flag = '' if ratio is None or ratio <= 1 + ns.tolerance else '  REGRESSION'
+        print(f"{key}: {_format(old)} -> {_format(new)} (x{_format(ratio)}){flag}")
+    return int(regressed)
+
+
+if __name__ == '__main__':
+    _sys.exit(main())
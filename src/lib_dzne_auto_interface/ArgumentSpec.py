@@ -0,0 +1,173 @@
+"""Immutable description of a single command line argument. 
+
+A spec holds the same values that the argparse action would hold 
+but it creates the action only when it is added to a parser. """
+
+
+class ArgumentSpec(object):
+    __slots__ = (
+        'option_strings',
+        'action',
+        'dest',
+        'nargs',
+        'const',
+        'default',
+        'type',
+        'choices',
+        'required',
+        'help',
+        'of_return',
+    )
+    def __init__(self, **kwargs):
+        if set(kwargs.keys()) != set(self.__slots__):
+            raise KeyError(set(kwargs.keys()) ^ set(self.__slots__))
+        for key, value in kwargs.items():
+            object.__setattr__(self, key, value)
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable. ")
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable. ")
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    def __repr__(self):
+        items = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{type(self).__name__}({items})"
+    def __reduce__(self):
+        return (_from_dict, (type(self), self.to_dict()))
+    def to_dict(self):
+        return {k:getattr(self, k) for k in self.__slots__}
+    def replace(self, **kwargs):
+        for key in kwargs.keys():
+            if key not in self.__slots__:
+                raise KeyError(key)
+        ans = self.to_dict()
+        ans.update(kwargs)
+        ans['option_strings'] = tuple(ans['option_strings'])
+        ans['required'] = bool(ans['required'])
+        ans['of_return'] = bool(ans['of_return'])
+        _check_types(ans)
+        return type(self)(**ans)
+    @property
+    def positional(self):
+        return not bool(len(self.option_strings))
+    @classmethod
+    def make(cls, dictionary, /):
+        """Normalize the keyword arguments of an argument 
+        in the same way as argparse's add_argument does. """
+        dictionary = dict(dictionary)
+        for key in dictionary.keys():
+            if key not in cls.__slots__:
+                raise KeyError(key)
+        _check_types(dictionary)
+        option_strings = tuple(dictionary.pop('option_strings', ()))
+        action = dictionary.pop('action', 'store')
+        if action not in (
+            'store', 
+            'store_true', 
+            'store_false', 
+            #'store_const',
+            #'append',
+            #'append_const',
+        ):
+            raise ValueError()
+        ans = {
+            'action': action,
+            'of_return': bool(dictionary.pop('of_return', False)),
+            'help': dictionary.pop('help', None),
+        }
+        required = bool(dictionary.pop('required', False))
+        if (len(option_strings) == 1) and not option_strings[0].startswith('-'):
+            if 'dest' in dictionary.keys():
+                raise ValueError('dest supplied twice for positional argument')
+            dictionary['dest'] = option_strings[0]
+            option_strings = ()
+        ans['option_strings'] = option_strings
+        if len(option_strings):
+            ans['dest'] = _optional_dest(option_strings, dictionary.pop('dest', None))
+        elif required:
+            raise TypeError("'required' is an invalid argument for positionals")
+        elif 'dest' not in dictionary.keys():
+            raise TypeError("A positional argument needs a dest. ")
+        else:
+            ans['dest'] = dictionary.pop('dest')
+        if action == 'store':
+            ans['nargs'] = dictionary.pop('nargs', None)
+            ans['const'] = dictionary.pop('const', None)
+            ans['type'] = dictionary.pop('type', None)
+            ans['choices'] = dictionary.pop('choices', None)
+            if ans['nargs'] == 0:
+                raise ValueError('nargs for store actions must be != 0; if you '
+                    'have nothing to store, actions such as store '
+                    'true or store const may be more appropriate')
+            if (ans['const'] is not None) and (ans['nargs'] != '?'):
+                raise ValueError('nargs must be %r to supply const' % '?')
+            if (ans['type'] is not None) and not callable(ans['type']):
+                raise ValueError('%r is not callable' % (ans['type'],))
+        else:
+            ans['nargs'] = 0
+            ans['const'] = (action == 'store_true')
+            ans['type'] = None
+            ans['choices'] = None
+        has_default = 'default' in dictionary.keys()
+        if has_default:
+            ans['default'] = dictionary.pop('default')
+        else:
+            ans['default'] = {'store': None, 'store_true': False, 'store_false': True}[action]
+        if len(dictionary):
+            key = list(dictionary.keys())[0]
+            raise TypeError(f"{key!r} is an invalid argument for the action {action!r}. ")
+        if len(option_strings):
+            ans['required'] = required
+        elif ans['nargs'] not in ('?', '*'):
+            ans['required'] = True
+        else:
+            ans['required'] = (ans['nargs'] == '*') and not has_default
+        return cls(**ans)
+    def add_to(self, parser):
+        """Create the argparse action within parser. """
+        kwargs = {
+            'action': self.action,
+            'dest': self.dest,
+            'default': self.default,
+            'help': self.help,
+        }
+        if self.action == 'store':
+            kwargs['nargs'] = self.nargs
+            kwargs['const'] = self.const
+            kwargs['type'] = self.type
+            kwargs['choices'] = self.choices
+        if not self.positional:
+            kwargs['required'] = self.required
+        elif (self.nargs == '*') and self.required:
+            del kwargs['default'] # argparse infers required from its absence
+        return parser.add_argument(*self.option_strings, **kwargs)
+
+
+def _from_dict(cls, dictionary):
+    return cls(**dictionary)
+
+def _check_types(dictionary):
+    Help = type(dictionary.get('help', None))
+    if Help not in (type(None), str):
+        raise TypeError(f"{Help.__name__} is not a valid type for the parameter 'help'. ")
+    Nargs = type(dictionary.get('nargs', None))
+    if Nargs not in (type(None), str, int):
+        raise TypeError(f"{Nargs.__name__} is not a valid type for the parameter 'nargs'. ")
+
+def _optional_dest(option_strings, dest):
+    for option_string in option_strings:
+        if not option_string.startswith('-'):
+            raise ValueError(f"invalid option string {option_string!r}: must start with a character '-'")
+    if dest is not None:
+        return dest
+    long_option_strings = [x for x in option_strings if x.startswith('--')]
+    if len(long_option_strings):
+        dest = long_option_strings[0]
+    else:
+        dest = option_strings[0]
+    dest = dest.lstrip('-')
+    if not dest:
+        raise ValueError(f"dest= is required for options like {option_strings[-1]!r}")
+    return dest.replace('-', '_')
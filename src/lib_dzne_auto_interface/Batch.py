@@ -0,0 +1,128 @@
+import collections as _col
+import collections.abc as _abc
+import concurrent.futures as _cf
+import contextvars as _cv
+import multiprocessing as _mp
+import os as _os
+import time as _time
+
+
+class Outcome(object):
+    def __init__(self, index, *, value=None, error=None, seconds=None):
+        self._index = index
+        self._value = value
+        self._error = error
+        self._seconds = seconds
+    @property
+    def index(self):
+        return self._index
+    @property
+    def value(self):
+        return self._value
+    @property
+    def error(self):
+        return self._error
+    @property
+    def seconds(self):
+        """Time spent in the worker; None if the job never got there. """
+        return self._seconds
+    @property
+    def ok(self):
+        return self._error is None
+    def get(self):
+        if self._error is not None:
+            raise self._error
+        return self._value
+    def __repr__(self):
+        cls = type(self)
+        if self.ok:
+            return f"{cls.__name__}({self.index}, value={self.value!r})"
+        return f"{cls.__name__}({self.index}, error={self.error!r})"
+
+
+def run(knot, jobs, *, workers=None, executor='thread', ordered=True):
+    """Yield one Outcome per job. 
+
+    Each job is either a list of command line arguments 
+    or a dictionary as accepted by run_dictionary. 
+    Jobs are parsed here and run on a thread or process pool; 
+    the outcomes come in input order or, if ordered is False, 
+    in the order in which they finish. """
+    if workers is None:
+        workers = _os.cpu_count() or 1
+    pool, func = _pool(knot, workers=workers, executor=executor)
+    pending = _col.deque()
+    with pool:
+        for index, job in enumerate(jobs):
+            pending.append((index, _submit(pool, func, knot, job)))
+            if len(pending) >= 2 * workers:
+                yield _next(pending, ordered=ordered)
+        while len(pending):
+            yield _next(pending, ordered=ordered)
+
+
+def _pool(knot, *, workers, executor):
+    if executor == 'thread':
+        pool = _cf.ThreadPoolExecutor(max_workers=workers)
+        return pool, knot._run_dictionary
+    if executor == 'process':
+        # forked workers inherit the built knot instead of unpickling it
+        if 'fork' in _mp.get_all_start_methods():
+            context = _mp.get_context('fork')
+        else:
+            context = None
+        pool = _cf.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(knot,),
+        )
+        return pool, _run_in_worker
+    raise ValueError(f"{executor!r} is not a valid executor; use 'thread' or 'process'. ")
+
+def _submit(pool, func, knot, job):
+    try:
+        if isinstance(job, _abc.Mapping):
+            dictionary = dict(job)
+        else:
+            dictionary = knot.parse(job, add_help=True)
+    except (Exception, SystemExit) as exc:
+        ans = _cf.Future()
+        ans.set_exception(exc)
+        return ans
+    if isinstance(pool, _cf.ThreadPoolExecutor):
+        # the phases of the job belong to the run that submitted it; see Timing
+        return pool.submit(_cv.copy_context().run, _timed, func, dictionary)
+    return pool.submit(_timed, func, dictionary)
+
+def _next(pending, *, ordered):
+    if ordered:
+        index, future = pending.popleft()
+    else:
+        futures = [f for i, f in pending]
+        done, undone = _cf.wait(futures, return_when=_cf.FIRST_COMPLETED)
+        index, future = next(x for x in pending if x[1] in done)
+        pending.remove((index, future))
+    try:
+        value, error, seconds = future.result()
+    except (Exception, SystemExit) as exc:
+        return Outcome(index, error=exc)
+    return Outcome(index, value=value, error=error, seconds=seconds)
+
+def _timed(func, dictionary):
+    start = _time.perf_counter()
+    try:
+        value = func(dictionary)
+    except (Exception, SystemExit) as exc:
+        return None, exc, _time.perf_counter() - start
+    return value, None, _time.perf_counter() - start
+
+
+_worker_knot = None
+
+def _init_worker(knot):
+    global _worker_knot
+    _worker_knot = knot
+
+def _run_in_worker(dictionary):
+    return _worker_knot._run_dictionary(dictionary)
@@ -0,0 +1,56 @@
+"""The client of lib_dzne_auto_interface.Daemon.
+
+It only needs multiprocessing.connection, not the rest of the package: 
+
+    python -m lib_dzne_auto_interface.Client SOCKET [ARGS ...] """
+
+import multiprocessing.connection as _mpc
+import os as _os
+import sys as _sys
+
+
+def key_path(path):
+    """The file that holds the key of the server listening on path. """
+    return path + '.key'
+
+def read_key(path):
+    # only the owner of the server can read its key
+    with open(key_path(path), 'rb') as stream:
+        return stream.read()
+
+
+def client(path, args, *, stdin=None, stdout=None, stderr=None):
+    """Run args on the server at path and return the exit code. """
+    stdin = _sys.stdin if (stdin is None) else stdin
+    stdout = _sys.stdout if (stdout is None) else stdout
+    stderr = _sys.stderr if (stderr is None) else stderr
+    with _mpc.Client(path, family='AF_UNIX', authkey=read_key(path)) as connection:
+        connection.send({
+            'args': list(args),
+            'cwd': _os.getcwd(),
+        })
+        streams = {'stdout': stdout, 'stderr': stderr}
+        while True:
+            kind, value = connection.recv()
+            if kind == 'exit':
+                return value
+            if kind == 'stdin':
+                method, size = value
+                data = "" if (stdin is None) else getattr(stdin, method)(size)
+                connection.send(data)
+                continue
+            streams[kind].write(value)
+            streams[kind].flush()
+
+def main(args=None):
+    """Usage: python -m lib_dzne_auto_interface.Client SOCKET [ARGS ...]"""
+    if args is None:
+        args = _sys.argv[1:]
+    if not len(args):
+        print(main.__doc__, file=_sys.stderr)
+        return 2
+    return client(args[0], args[1:])
+
+
+if __name__ == '__main__':
+    _sys.exit(main())
@@ -0,0 +1,259 @@
+"""Static shell completion scripts generated from the knot tree.
+
+The scripts hold precomputed tables of the subcommands,
+option strings, choices and file extensions of every level,
+so completing a word needs no Python process.
+The bash script needs bash 4 (associative arrays);
+the zsh script uses compadd and _files of the zsh completion system,
+so it is sourced after compinit. """
+
+import re as _re
+import shlex as _shlex
+
+import lib_dzne_filedata as _fd
+
+import lib_dzne_auto_interface as _lib
+
+
+def _arity(argument):
+    """The number of words an option consumes; '*' for all up to the next option. """
+    if argument.action != 'store':
+        return '0' # store_true and store_false
+    if argument.nargs in (None, '?'):
+        return '1'
+    if type(argument.nargs) is int:
+        return str(argument.nargs)
+    return '*'
+
+def _values(argument):
+    """What the words of argument complete to, as stored in the tables. """
+    if argument.choices is not None:
+        return "\n".join(['c'] + [str(x) for x in argument.choices])
+    if (argument.type is not None) and _fd.is_File(argument.type):
+        return "\n".join(['f', argument.type(None).ext])
+    return ""
+
+
+def levels(knot):
+    """Flatten the tree below knot into a list of levels.
+
+    Each level is a dict with the keys
+    'commands' (name -> index of its level),
+    'options' (option string -> (arity, values)),
+    'positionals' (the values of each positional word) and
+    'rest' (the values of all further positional words or None). """
+    ans = list()
+    _add_level(ans, knot)
+    return ans
+
+def _add_level(ans, knot):
+    level = {
+        'commands': dict(),
+        'options': {'-h':('0', ""), '--help':('0', "")},
+        'positionals': list(),
+        'rest': None,
+    }
+    ans.append(level)
+    if isinstance(knot, _lib._Uncallable):
+        for name, main in knot.mains.items():
+            level['commands'][name] = len(ans)
+            _add_level(ans, main)
+        return
+    arguments = list()
+    for parameter in knot.parameters:
+        arguments += parameter.subknots
+    if knot.argument_of_return is not None:
+        arguments.append(knot.argument_of_return)
+    for argument in arguments:
+        values = _values(argument)
+        if not argument.positional:
+            for option_string in argument.option_strings:
+                level['options'][option_string] = (_arity(argument), values)
+            continue
+        if level['rest'] is not None:
+            continue
+        if argument.nargs in (None, '?'):
+            level['positionals'].append(values)
+        elif type(argument.nargs) is int:
+            level['positionals'] += [values] * argument.nargs
+        else:
+            level['rest'] = values
+
+
+def _name(prog):
+    return "_" + _re.sub(r'\W', '_', prog) + "_complete"
+
+def _assoc(variable, items, *, shell):
+    if shell == 'bash':
+        lines = [f"declare -gA {variable}=("]
+        for key, value in items:
+            lines.append(f"    [{_shlex.quote(key)}]={_shlex.quote(value)}")
+    else:
+        # zsh before 5.5 does not know the [key]=value form
+        lines = [f"typeset -gA {variable}", f"{variable}=("]
+        for key, value in items:
+            lines.append(f"    {_shlex.quote(key)} {_shlex.quote(value)}")
+    lines.append(")")
+    return "\n".join(lines)
+
+def _tables(name, levels, *, shell):
+    commands = list()
+    children = list()
+    options = list()
+    arities = list()
+    values = list()
+    for index, level in enumerate(levels):
+        commands.append((str(index), "\n".join(level['commands'].keys())))
+        options.append((str(index), "\n".join(level['options'].keys())))
+        for command, child in level['commands'].items():
+            children.append((f"{index} {command}", str(child)))
+        for option_string, (arity, value) in level['options'].items():
+            arities.append((f"{index} {option_string}", arity))
+            values.append((f"{index} {option_string}", value))
+        for position, value in enumerate(level['positionals']):
+            values.append((f"{index} #{position}", value))
+        if level['rest'] is not None:
+            values.append((f"{index} #*", level['rest']))
+    return "\n".join([
+        _assoc(f"{name}_commands", commands, shell=shell),
+        _assoc(f"{name}_children", children, shell=shell),
+        _assoc(f"{name}_options", options, shell=shell),
+        _assoc(f"{name}_arities", arities, shell=shell),
+        _assoc(f"{name}_values", values, shell=shell),
+    ])
+
+_BASH = r"""
+NAME() {
+    local cur=${COMP_WORDS[COMP_CWORD]} node=0 pos=0 pending=0 option= word child i
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word=${COMP_WORDS[i]}
+        if [[ $word == -* ]]; then
+            option=$word pending=0
+            [[ $word == *=* ]] && continue
+            case ${NAME_arities["$node $word"]} in
+                '*') pending=-1 ;;
+                ''|0) ;;
+                *) pending=${NAME_arities["$node $word"]} ;;
+            esac
+            continue
+        fi
+        if ((pending > 0)); then
+            ((pending--))
+            continue
+        fi
+        ((pending < 0)) && continue
+        child=${NAME_children["$node $word"]}
+        if [[ -n $child ]]; then
+            node=$child pos=0
+            continue
+        fi
+        ((pos++))
+    done
+    local IFS=$'\n' key
+    if [[ $cur == -* ]]; then
+        COMPREPLY=($(compgen -W "${NAME_options[$node]}" -- "$cur"))
+        return
+    fi
+    if ((pending != 0)); then
+        key="$node $option"
+    elif [[ -n ${NAME_commands[$node]} ]]; then
+        COMPREPLY=($(compgen -W "${NAME_commands[$node]}" -- "$cur"))
+        return
+    elif [[ -n ${NAME_values["$node #$pos"]+set} ]]; then
+        key="$node #$pos"
+    else
+        key="$node #*"
+    fi
+    local values=${NAME_values[$key]}
+    case ${values%%$'\n'*} in
+        c) COMPREPLY=($(compgen -W "${values#c$'\n'}" -- "$cur")) ;;
+        f)
+            compopt -o filenames 2>/dev/null
+            COMPREPLY=($(compgen -d -- "$cur") $(compgen -f -X "!*${values#f$'\n'}" -- "$cur"))
+            ;;
+    esac
+}
+"""
+
+# the same walk as _BASH over the 1-based words of zsh
+_ZSH = r"""
+NAME() {
+    emulate -L zsh
+    local cur=${words[CURRENT]} node=0 pos=0 pending=0 option= word child key values i
+    for ((i = 2; i < CURRENT; i++)); do
+        word=${words[i]}
+        if [[ $word == -* ]]; then
+            option=$word pending=0
+            [[ $word == *=* ]] && continue
+            key="$node $word"
+            case ${NAME_arities[$key]} in
+                '*') pending=-1 ;;
+                ''|0) ;;
+                *) pending=${NAME_arities[$key]} ;;
+            esac
+            continue
+        fi
+        if ((pending > 0)); then
+            ((pending--))
+            continue
+        fi
+        ((pending < 0)) && continue
+        key="$node $word"
+        child=${NAME_children[$key]}
+        if [[ -n $child ]]; then
+            node=$child pos=0
+            continue
+        fi
+        ((pos++))
+    done
+    if [[ $cur == -* ]]; then
+        compadd -- ${(f)NAME_options[$node]}
+        return
+    fi
+    if ((pending != 0)); then
+        key="$node $option"
+    elif [[ -n ${NAME_commands[$node]} ]]; then
+        compadd -- ${(f)NAME_commands[$node]}
+        return
+    else
+        key="$node #$pos"
+        ((${+NAME_values[$key]})) || key="$node #*"
+    fi
+    values=${NAME_values[$key]}
+    case ${values%%$'\n'*} in
+        c) compadd -- ${(f)values#c$'\n'} ;;
+        f) _files -g "*${values#f$'\n'}" ;;
+        *) _files ;;
+    esac
+}
+"""
+
+
+def bash(knot, *, prog):
+    """Return a bash completion script for the command prog. """
+    name = _name(prog)
+    return "\n".join([
+        f"# bash completion for {prog}; generated by lib_dzne_auto_interface",
+        _tables(name, levels(knot), shell='bash'),
+        _BASH.replace('NAME', name),
+        f"complete -o default -F {name} {_shlex.quote(prog)}",
+        "",
+    ])
+
+def zsh(knot, *, prog):
+    """Return a zsh completion script for the command prog. """
+    name = _name(prog)
+    return "\n".join([
+        f"# zsh completion for {prog}; generated by lib_dzne_auto_interface",
+        _tables(name, levels(knot), shell='zsh'),
+        _ZSH.replace('NAME', name),
+        f"compdef {name} {_shlex.quote(prog)}",
+        "",
+    ])
+
+def script(knot, shell, *, prog):
+    if shell == 'bash':
+        return bash(knot, prog=prog)
+    if shell == 'zsh':
+        return zsh(knot, prog=prog)
+    raise ValueError(f"The shell {shell!r} is not supported. ")
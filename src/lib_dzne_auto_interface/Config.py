@@ -0,0 +1,171 @@
+"""Running knots from structured values, e.g. JSON or TOML files.
+
+A config is a mapping from dests to values; the dest of an
+uncallable selects the command, as in the dictionaries of run_dictionary.
+The rules of every argument (type, choices, nargs and required)
+are applied to the values directly, without a detour through argv.
+Strings are converted by type, like argparse would;
+other values must already be instances of type (an integer does
+for a float, a boolean does not for an integer) and are never converted. 
+Flags take booleans only (true and false in JSON and TOML). 
+
+Several jobs go into one file as
+
+    {"defaults": {...}, "jobs": [{...}, {...}]}
+
+where every job is merged over the optional defaults. """
+
+import collections.abc as _abc
+import json as _json
+import os as _os
+import sys as _sys
+import tomllib as _tomllib
+
+import lib_dzne_auto_interface as _lib
+
+
+class ConfigError(ValueError):
+    pass
+
+
+def load(file):
+    """Read a config from a .json or .toml file. """
+    ext = _os.path.splitext(file)[1].lower()
+    if ext == '.json':
+        with open(file, 'r') as stream:
+            return _json.load(stream)
+    if ext == '.toml':
+        with open(file, 'rb') as stream:
+            return _tomllib.load(stream)
+    raise ConfigError(f"The config file {file!r} must end in '.json' or '.toml'. ")
+
+def jobs(config):
+    """The list of job mappings in config (a mapping or a file). """
+    if not isinstance(config, _abc.Mapping):
+        config = load(config)
+    if 'jobs' not in config.keys():
+        return [dict(config)]
+    defaults = dict(config.get('defaults', {}))
+    unknown = set(config.keys()) - {'jobs', 'defaults'}
+    if len(unknown):
+        raise ConfigError(f"Unknown top level keys {sorted(unknown)} next to 'jobs'. ")
+    return [dict(defaults, **x) for x in config['jobs']]
+
+
+def convert(knot, mapping):
+    """Return the dictionary for run_dictionary that mapping stands for. """
+    mapping = dict(mapping)
+    ans = dict()
+    while isinstance(knot, _lib._Uncallable):
+        name = mapping.pop(knot.dest, None)
+        if name not in knot.names:
+            raise ConfigError(f"{knot.dest}: the command must be one of {knot.names}, not {name!r}. ")
+        ans[knot.dest] = name
+        knot = knot.main(name)
+    arguments = list()
+    for parameter in knot.parameters:
+        arguments += parameter.subknots
+    if knot.argument_of_return is not None:
+        arguments.append(knot.argument_of_return)
+    for argument in arguments:
+        if argument.dest in mapping.keys():
+            ans[argument.dest] = _value(argument, mapping.pop(argument.dest))
+        elif argument.required:
+            raise ConfigError(f"{argument.dest}: the argument is required. ")
+        else:
+            ans[argument.dest] = _default(argument)
+    if len(mapping):
+        raise ConfigError(f"Unknown keys {sorted(mapping.keys())}. ")
+    return ans
+
+def _default(argument):
+    # argparse converts string defaults as well
+    if (type(argument.default) is str) and (argument.type is not None):
+        return _convert(argument, argument.default)
+    return argument.default
+
+def _value(argument, value):
+    # the spec only allows store, store_true and store_false
+    if argument.action != 'store':
+        if type(value) is not bool:
+            raise ConfigError(f"{argument.dest}: true or false is expected, not {value!r}. ")
+        return value
+    return _single(argument, value)
+
+def _single(argument, value):
+    nargs = argument.nargs
+    if nargs in (None, '?'):
+        if (value is None) and (nargs == '?'):
+            return argument.const
+        return _item(argument, value)
+    if not isinstance(value, list):
+        raise ConfigError(f"{argument.dest}: a list of values is expected. ")
+    if (type(nargs) is int) and (len(value) != nargs):
+        raise ConfigError(f"{argument.dest}: exactly {nargs} values are expected, not {len(value)}. ")
+    if (nargs == '+') and not len(value):
+        raise ConfigError(f"{argument.dest}: at least one value is expected. ")
+    return [_item(argument, x) for x in value]
+
+def _item(argument, value):
+    ans = _convert(argument, value)
+    if (argument.choices is not None) and (ans not in argument.choices):
+        raise ConfigError(f"{argument.dest}: {value!r} is not one of {list(argument.choices)}. ")
+    return ans
+
+def _convert(argument, value):
+    func = argument.type
+    if func is None:
+        return value
+    if type(value) is not str:
+        # only strings are parsed; other values must already have the type
+        if (func is float) and (type(value) is int):
+            return float(value)
+        if isinstance(func, type) and isinstance(value, func) and ((type(value) is not bool) or (func is bool)):
+            return value
+        name = getattr(func, '__name__', repr(func))
+        raise ConfigError(f"{argument.dest}: a {name} value is expected, not {value!r}. ")
+    try:
+        return func(value)
+    except Exception as exc:
+        name = getattr(func, '__name__', repr(func))
+        raise ConfigError(f"{argument.dest}: invalid {name} value {value!r}: {exc}") from exc
+
+
+def run(knot, config, *, workers=None, executor='thread'):
+    """Run every job of config against knot.
+
+    All jobs are converted before the first one runs.
+    A config without 'jobs' returns the result of its single job;
+    otherwise one Outcome per job is returned, as by run_batch. """
+    if not isinstance(config, _abc.Mapping):
+        config = load(config)
+    dictionaries = list()
+    for index, job in enumerate(jobs(config)):
+        try:
+            dictionaries.append(convert(knot, job))
+        except ConfigError as exc:
+            if 'jobs' not in config.keys():
+                raise
+            raise ConfigError(f"job {index}: {exc}") from exc
+    if 'jobs' not in config.keys():
+        return knot._run_dictionary(dictionaries[0])
+    return list(knot.run_batch(dictionaries, workers=workers, executor=executor))
+
+
+def run_cli(knot, args):
+    """Usage: PROG --config FILE
+
+    Runs the jobs of the .json or .toml FILE. """
+    if len(args) != 1:
+        raise SystemExit(run_cli.__doc__)
+    try:
+        ans = run(knot, args[0])
+    except ConfigError as exc:
+        raise SystemExit(f"{args[0]}: {exc}")
+    if type(ans) is not list:
+        return
+    failed = [x for x in ans if not x.ok]
+    for outcome in failed:
+        print(f"job {outcome.index}: {type(outcome.error).__name__}: {outcome.error}", file=_sys.stderr)
+    if len(failed):
+        raise SystemExit(1)
@@ -0,0 +1,177 @@
+"""Serving command line invocations from a resident knot. 
+
+The server keeps the built knot (and everything it imported) in memory 
+and runs the argument vectors it receives over a Unix domain socket. 
+The client forwards its arguments and working directory, 
+answers reads from stdin as they happen 
+and replays the output and the exit code of the run; 
+it lives in Client, which imports nothing else of this package. 
+The socket is only accessible to its owner, 
+and both sides prove that they know a key stored next to it 
+(readable by the owner only) before anything is unpickled. """
+
+import concurrent.futures as _cf
+import contextlib as _ctx
+import io as _io
+import multiprocessing.connection as _mpc
+import os as _os
+import socket as _socket
+import sys as _sys
+import threading as _th
+import traceback as _tb
+
+import lib_dzne_auto_interface.Client as _Client
+import lib_dzne_auto_interface.Job as _Job
+
+
+def serve(knot, path, *, workers=4):
+    """Serve run_cli of knot on the socket path until interrupted. """
+    _remove_stale(path)
+    key = _write_key(path)
+    try:
+        listener = _mpc.Listener(path, family='AF_UNIX', authkey=key)
+        # whoever connected before the chmod still fails the challenge
+        _os.chmod(path, 0o600)
+        directories = _DirectoryLock()
+        with listener, _cf.ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                try:
+                    connection = listener.accept()
+                except (_mpc.AuthenticationError, EOFError, ConnectionError):
+                    continue # e.g. a client without the key
+                pool.submit(_handle, knot, connection, directories)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for file in (path, _Client.key_path(path)):
+            if _os.path.exists(file):
+                _os.remove(file)
+
+def client(path, args, *, stdin=None, stdout=None, stderr=None):
+    """Run args on the server at path and return the exit code. """
+    return _Client.client(path, args, stdin=stdin, stdout=stdout, stderr=stderr)
+
+def main(args=None):
+    return _Client.main(args)
+
+
+class _Forward(object):
+    def __init__(self, connection, lock, kind):
+        self._connection = connection
+        self._lock = lock
+        self._kind = kind
+    def write(self, text):
+        if len(text):
+            with self._lock:
+                self._connection.send((self._kind, text))
+        return len(text)
+    def flush(self):
+        pass
+    def isatty(self):
+        return False
+
+class _RemoteStdin(_io.TextIOBase):
+    # stdin is only read from the client when the run asks for it
+    def __init__(self, connection, lock):
+        self._connection = connection
+        self._lock = lock
+    def readable(self):
+        return True
+    def read(self, size=-1):
+        return self._request('read', size)
+    def readline(self, size=-1):
+        return self._request('readline', size)
+    def _request(self, method, size):
+        with self._lock:
+            self._connection.send(('stdin', (method, size)))
+            return self._connection.recv()
+
+class _DirectoryLock(object):
+    # runs in the server's working directory may overlap; 
+    # a run elsewhere has to change it for the whole process 
+    # and therefore waits until it has the process to itself
+    def __init__(self):
+        self._home = _os.getcwd()
+        self._condition = _th.Condition()
+        self._shared = 0
+        self._exclusive = False
+    @_ctx.contextmanager
+    def directory(self, cwd):
+        if _os.path.realpath(cwd) == _os.path.realpath(self._home):
+            with self._condition:
+                self._condition.wait_for(lambda: not self._exclusive)
+                self._shared += 1
+            try:
+                yield
+            finally:
+                with self._condition:
+                    self._shared -= 1
+                    self._condition.notify_all()
+            return
+        with self._condition:
+            self._condition.wait_for(lambda: not (self._exclusive or self._shared))
+            self._exclusive = True
+        try:
+            _os.chdir(cwd)
+            yield
+        finally:
+            _os.chdir(self._home)
+            with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+def _handle(knot, connection, directories):
+    with connection:
+        try:
+            request = connection.recv()
+        except EOFError:
+            return
+        lock = _th.Lock()
+        stdout = _Forward(connection, lock, 'stdout')
+        stderr = _Forward(connection, lock, 'stderr')
+        stdin = _RemoteStdin(connection, lock)
+        with _Job.redirect_stdin(stdin), _Job.redirect_stdout(stdout), _Job.redirect_stderr(stderr):
+            code = _run(knot, request, directories)
+        try:
+            connection.send(('exit', code))
+        except OSError:
+            pass # the client is gone
+
+def _run(knot, request, directories):
+    try:
+        with directories.directory(request['cwd']):
+            knot.run_cli(request['args'])
+    except SystemExit as exc:
+        if (exc.code is None) or (type(exc.code) is int):
+            return exc.code or 0
+        print(exc.code, file=_sys.stderr)
+        return 1
+    except BaseException:
+        _tb.print_exc()
+        return 1
+    return 0
+
+def _write_key(path):
+    key = _os.urandom(32)
+    file = _Client.key_path(path)
+    if _os.path.exists(file):
+        _os.remove(file) # _remove_stale found no server
+    fd = _os.open(file, _os.O_WRONLY | _os.O_CREAT | _os.O_EXCL, 0o600)
+    with open(fd, 'wb') as stream:
+        stream.write(key)
+    return key
+
+def _remove_stale(path):
+    if not _os.path.exists(path):
+        return
+    with _socket.socket(_socket.AF_UNIX) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            _os.remove(path) # left behind by a server that is gone
+            return
+    raise FileExistsError(f"A server is already listening on {path!r}. ")
+
+
+if __name__ == '__main__':
+    _sys.exit(main())
@@ -0,0 +1,38 @@
+"""Writing files atomically, with the permissions open() would give them.
+
+tempfile.mkstemp creates its files with mode 0600,
+whereas lib_dzne_filedata creates them with 0666 less the umask;
+the files here are created like the latter and only appear
+under their final name once they are complete. """
+
+import os as _os
+import secrets as _secrets
+
+
+def temporary(target):
+    """Create an empty file next to target; returns its descriptor and path. """
+    directory, name = _os.path.split(_os.path.abspath(target))
+    while True:
+        path = _os.path.join(directory, f".{name}.{_secrets.token_hex(4)}.tmp")
+        try:
+            fd = _os.open(path, _os.O_WRONLY | _os.O_CREAT | _os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        return fd, path
+
+def publish(path, target):
+    """Move the file at path to target, which must not exist yet. """
+    try:
+        # unlike a rename, a link never replaces an existing file
+        _os.link(path, target)
+    except FileExistsError:
+        _os.remove(path)
+        raise FileExistsError(f"The file {target.__repr__()} already exists. ") from None
+    except OSError:
+        # file systems without hard links
+        if _os.path.exists(target):
+            _os.remove(path)
+            raise FileExistsError(f"The file {target.__repr__()} already exists. ") from None
+        _os.replace(path, target)
+        return
+    _os.remove(path)
@@ -1,3 +1,5 @@
+import itertools as _it
+
 
 class Information(object):
     def __init__(self, *, args=[], kwargs={}):
@@ -75,4 +77,29 @@ class Information(object):
         return func(*self._args, **self._kwargs)
 
 
- 
+class Builder(object):
+    """Collects arguments for a single call. 
+
+    Sequences given to extend are kept by reference 
+    and are only unpacked once, when the call is made. """
+    def __init__(self):
+        self._chunks = list()
+        self._kwargs = dict()
+    def append(self, value):
+        self._chunks.append((value,))
+    def extend(self, values):
+        self._chunks.append(values)
+    def update(self, kwargs):
+        for key, value in kwargs.items():
+            if type(key) is not str:
+                raise TypeError()
+            if key in self._kwargs.keys():
+                raise TypeError(f"got multiple values for keyword argument {key!r}")
+            self._kwargs[key] = value
+    def freeze(self):
+        return Information(
+            args=_it.chain.from_iterable(self._chunks),
+            kwargs=self._kwargs,
+        )
+    def exec(self, func):
+        return func(*_it.chain.from_iterable(self._chunks), **self._kwargs)
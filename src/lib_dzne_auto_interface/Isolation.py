@@ -0,0 +1,290 @@
+"""Running the wrapped callables in child processes.
+
+Once enabled, every call of a _Callable happens in a child process,
+so a function that hangs, leaks or crashes cannot take the
+GUI, a batch or the daemon down with it.
+The child is forked if the calling process has no other threads.
+Otherwise forking could copy locks that other threads hold,
+so the call runs in a new interpreter, started like the children of
+multiprocessing's spawn method; the callable and its arguments are pickled,
+so they must be importable, and the main module is imported
+as __mp_main__ (its "if __name__ == '__main__'" block does not run).
+The child can be bounded in wall-clock time (timeout),
+address space (memory, via RLIMIT_AS) and CPU time (cpu, via RLIMIT_CPU);
+it is killed when the limit is hit or the waiting thread is
+interrupted (e.g. by a cancelled GUI job).
+Its output is forwarded to the sys.stdout and sys.stderr of the caller.
+The result (or exception) comes back pickled in a temporary file,
+which is not limited in size like a pipe is; the items of an
+iterator are pickled one by one in the child
+and read back one by one as the returned iterator is consumed. """
+
+import codecs as _codecs
+import collections.abc as _abc
+import multiprocessing.spawn as _mpspawn
+import os as _os
+import pickle as _pickle
+import select as _select
+import signal as _signal
+import sys as _sys
+import tempfile as _tmp
+import threading as _threading
+import time as _time
+import traceback as _tb
+
+import lib_dzne_auto_interface as _lib
+
+_SLICE = 0.1 # seconds between checks for interruptions
+
+# the new interpreter reads the request from the file it then writes its outcome to
+_BOOT = """
+import pickle, sys
+file = sys.argv[1]
+stream = open(file, 'rb')
+import multiprocessing.spawn
+multiprocessing.spawn.prepare(pickle.load(stream))
+from lib_dzne_auto_interface.Isolation import _spawned
+_spawned(stream, file)
+"""
+
+
+def enable(*, timeout=None, memory=None, cpu=None):
+    """Set lib_dzne_auto_interface.isolation to a new Policy. """
+    _lib.isolation = Policy(timeout=timeout, memory=memory, cpu=cpu)
+    return _lib.isolation
+
+def disable():
+    _lib.isolation = None
+
+
+class RemoteTraceback(Exception):
+    def __init__(self, text):
+        self.text = text
+    def __str__(self):
+        return self.text
+
+
+class Policy(object):
+    def __init__(self, *, timeout=None, memory=None, cpu=None):
+        if not (hasattr(_os, 'fork') and hasattr(_os, 'posix_spawn')):
+            raise NotImplementedError("Isolation needs os.fork and os.posix_spawn, which this platform lacks. ")
+        self._timeout = timeout
+        self._memory = memory
+        self._cpu = cpu
+    @property
+    def timeout(self):
+        """Seconds of wall-clock time per call. """
+        return self._timeout
+    @property
+    def memory(self):
+        """Bytes of address space per call, on top of what the child starts with. 
+
+        A forked child starts with the address space of the caller, 
+        a new interpreter with that of the interpreter and the imported modules; 
+        where /proc/self/statm is missing the limit is absolute. """
+        return self._memory
+    @property
+    def cpu(self):
+        """Seconds of CPU time per call. """
+        return self._cpu
+    def call(self, func, /, *args):
+        """Return func(*args) as called in a child process. """
+        fd, file = _tmp.mkstemp(prefix='lib_dzne_auto_interface_', suffix='.pickle')
+        _os.close(fd)
+        try:
+            if _threading.active_count() > 1:
+                pid, streams = self._spawn(func, args, file)
+            else:
+                pid, streams = self._fork(func, args, file)
+            self._wait(pid, streams)
+            stream = open(file, 'rb')
+        finally:
+            _os.remove(file)
+        return _load(stream)
+    def _fork(self, func, args, file):
+        outR, outW = _os.pipe()
+        errR, errW = _os.pipe()
+        for stream in (_sys.stdout, _sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        pid = _os.fork()
+        if pid == 0:
+            try:
+                _os.close(outR)
+                _os.close(errR)
+                _sys.stdout = open(outW, 'w', encoding='utf-8', buffering=1)
+                _sys.stderr = open(errW, 'w', encoding='utf-8', buffering=1)
+                _child(func, args, file, memory=self._memory, cpu=self._cpu)
+            finally:
+                _os._exit(1)
+        _os.close(outW)
+        _os.close(errW)
+        return pid, {outR:_sys.stdout, errR:_sys.stderr}
+    def _spawn(self, func, args, file):
+        try:
+            request = _pickle.dumps((func, args), protocol=_pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            raise TypeError(
+                "With other threads running the call is made in a new interpreter, "
+                f"which needs the callable and its arguments to be picklable: {exc}. "
+            ) from exc
+        preparation = _mpspawn.get_preparation_data('isolated')
+        # the child is no multiprocessing process and needs no key
+        preparation.pop('authkey', None)
+        with open(file, 'wb') as stream:
+            _pickle.dump(preparation, stream)
+            _pickle.dump((self._memory, self._cpu), stream)
+            stream.write(request)
+        outR, outW = _os.pipe()
+        errR, errW = _os.pipe()
+        # the read ends are not inheritable and close on exec
+        actions = [
+            (_os.POSIX_SPAWN_OPEN, 0, _os.devnull, _os.O_RDONLY, 0),
+            (_os.POSIX_SPAWN_DUP2, outW, 1),
+            (_os.POSIX_SPAWN_DUP2, errW, 2),
+        ]
+        env = dict(_os.environ, PYTHONIOENCODING='utf-8', PYTHONUNBUFFERED='1')
+        try:
+            pid = _os.posix_spawn(_sys.executable, [_sys.executable, '-c', _BOOT, file], env, file_actions=actions)
+        except BaseException:
+            for fd in (outR, errR):
+                _os.close(fd)
+            raise
+        finally:
+            _os.close(outW)
+            _os.close(errW)
+        return pid, {outR:_sys.stdout, errR:_sys.stderr}
+    def _wait(self, pid, streams):
+        decoders = {fd:_Decoder() for fd in streams.keys()}
+        if self._timeout is not None:
+            deadline = _time.monotonic() + self._timeout
+        try:
+            # the pipes close when the child ends; 
+            # waiting in slices lets interruptions through
+            while len(streams):
+                wait = _SLICE
+                if self._timeout is not None:
+                    wait = min(wait, deadline - _time.monotonic())
+                    if wait <= 0:
+                        raise TimeoutError(f"The call did not finish within {self._timeout} seconds. ")
+                ready, w, x = _select.select(list(streams.keys()), [], [], wait)
+                for fd in ready:
+                    data = _os.read(fd, 1 << 16)
+                    streams[fd].write(decoders[fd](data))
+                    if not len(data):
+                        _os.close(fd)
+                        del streams[fd]
+            status = _os.waitpid(pid, 0)[1]
+        except BaseException:
+            _kill(pid)
+            for fd in streams.keys():
+                _os.close(fd)
+            raise
+        if _os.WIFSIGNALED(status):
+            number = _os.WTERMSIG(status)
+            if number == _signal.SIGXCPU:
+                raise TimeoutError(f"The call exceeded its CPU time of {self._cpu} seconds. ")
+            raise ChildProcessError(f"The call was ended by signal {_signal.Signals(number).name}. ")
+
+
+class _Decoder(object):
+    def __init__(self):
+        self._decoder = _codecs.getincrementaldecoder('utf-8')(errors='replace')
+    def __call__(self, data):
+        return self._decoder.decode(data, final=not len(data))
+
+
+def _kill(pid):
+    try:
+        _os.kill(pid, _signal.SIGKILL)
+        _os.waitpid(pid, 0)
+    except (ProcessLookupError, ChildProcessError):
+        pass
+
+def _load(stream):
+    try:
+        kind, value, text = _record(stream)
+    except BaseException:
+        stream.close()
+        raise
+    if kind == 'iterator':
+        return _items(stream)
+    stream.close()
+    if kind == 'value':
+        return value
+    value.__cause__ = RemoteTraceback(text)
+    raise value
+
+def _items(stream):
+    with stream:
+        while True:
+            kind, value, text = _record(stream)
+            if kind == 'end':
+                return
+            if kind == 'item':
+                yield value
+                continue
+            value.__cause__ = RemoteTraceback(text)
+            raise value
+
+def _record(stream):
+    try:
+        return _pickle.load(stream)
+    except EOFError:
+        raise ChildProcessError("The call ended without passing back a result. ") from None
+
+def _address_space():
+    try:
+        with open('/proc/self/statm') as stream:
+            pages = int(stream.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return pages * _os.sysconf('SC_PAGE_SIZE')
+
+def _spawned(stream, file):
+    with stream:
+        memory, cpu = _pickle.load(stream)
+        try:
+            func, args = _pickle.load(stream)
+        except BaseException as exc:
+            func, args = _raise, (exc,)
+    try:
+        _child(func, args, file, memory=memory, cpu=cpu)
+    finally:
+        _os._exit(1)
+
+def _raise(exc):
+    raise exc
+
+def _child(func, args, file, *, memory, cpu):
+    with open(file, 'wb') as stream:
+        try:
+            import resource as _resource
+            if memory is not None:
+                limit = _address_space() + memory
+                _resource.setrlimit(_resource.RLIMIT_AS, (limit, limit))
+            if cpu is not None:
+                _resource.setrlimit(_resource.RLIMIT_CPU, (cpu, cpu + 1))
+            value = func(*args)
+            if isinstance(value, _abc.Iterator):
+                # the items go out as they come, so none waits for the others
+                stream.write(_dumps('iterator', None))
+                for item in value:
+                    stream.write(_dumps('item', item))
+                stream.write(_dumps('end', None))
+            else:
+                stream.write(_dumps('value', value))
+        except BaseException as exc:
+            stream.write(_dumps('error', exc, _tb.format_exc()))
+    _sys.stdout.flush()
+    _sys.stderr.flush()
+    _os._exit(0)
+
+def _dumps(kind, value, text=None):
+    try:
+        return _pickle.dumps((kind, value, text), protocol=_pickle.HIGHEST_PROTOCOL)
+    except Exception as exc:
+        error = RuntimeError(f"The outcome of the call could not be passed back: {exc!r}. ")
+        return _pickle.dumps(('error', error, text or ""))
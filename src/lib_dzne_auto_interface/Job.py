@@ -0,0 +1,165 @@
+import contextlib as _ctx
+import ctypes as _ctypes
+import sys as _sys
+import threading as _th
+import time as _time
+
+
+class Cancelled(BaseException):
+    """Raised inside a job that was cancelled. """
+    pass
+
+
+class _ThreadStream(object):
+    # sys.stdin, sys.stdout and sys.stderr are shared by all threads; 
+    # this proxy lets every thread use streams of its own
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = _th.local()
+        self._users = 0 # redirections in effect; see _redirect
+    @property
+    def target(self):
+        ans = getattr(self._local, 'target', None)
+        return self._fallback if (ans is None) else ans
+    def write(self, text):
+        return self.target.write(text)
+    def flush(self):
+        return self.target.flush()
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+_install_lock = _th.Lock()
+
+@_ctx.contextmanager
+def _redirect(name, target):
+    with _install_lock:
+        stream = getattr(_sys, name)
+        if type(stream) is not _ThreadStream:
+            stream = _ThreadStream(stream)
+            setattr(_sys, name, stream)
+        stream._users += 1
+    previous = getattr(stream._local, 'target', None)
+    stream._local.target = target
+    try:
+        yield target
+    finally:
+        stream._local.target = previous
+        with _install_lock:
+            stream._users -= 1
+            # the proxy is removed with the last redirection 
+            # unless someone replaced it in the meantime
+            if (stream._users == 0) and (getattr(_sys, name) is stream):
+                setattr(_sys, name, stream._fallback)
+
+def redirect_stderr(target):
+    """Redirect stderr for the current thread only. """
+    return _redirect('stderr', target)
+
+def redirect_stdout(target):
+    """Redirect stdout for the current thread only. """
+    return _redirect('stdout', target)
+
+def redirect_stdin(target):
+    """Redirect stdin for the current thread only. """
+    return _redirect('stdin', target)
+
+
+def _set_async_exc(ident, exc):
+    # exc=None clears the pending exception
+    _ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        _ctypes.c_ulong(ident),
+        None if exc is None else _ctypes.py_object(exc),
+    )
+
+
+class Job(object):
+    def __init__(self, func, /, *args, stderr=None, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._stderr = stderr
+        self._result = None
+        self._exception = None
+        self._started = None
+        self._finished = None
+        self._cancelled = False
+        self._inside = False # whether func is being called
+        self._lock = _th.Lock() # guards _inside and the injection of Cancelled
+        self._thread = _th.Thread(target=self._run, daemon=True)
+    def start(self):
+        self._started = _time.monotonic()
+        self._thread.start()
+        return self
+    def _run(self):
+        # Cancelled can only be raised inside of _call, 
+        # so nothing here can be skipped by it
+        try:
+            with redirect_stderr(self._stderr):
+                self._call()
+        except BaseException as exc:
+            self._exception = exc
+        self._finished = _time.monotonic()
+    def _call(self):
+        with self._lock:
+            if self._cancelled:
+                raise Cancelled()
+            self._inside = True
+        outcome = None
+        try:
+            outcome = (self._func(*self._args, **self._kwargs),)
+        except Cancelled:
+            # injected just as func returned; its result stands
+            if outcome is None:
+                raise
+        finally:
+            self._leave()
+        self._result, = outcome
+    def _leave(self):
+        # a Cancelled injected before _inside was reset 
+        # may still be raised in here; it is swallowed and 
+        # any one that is pending is dropped
+        while True:
+            try:
+                with self._lock:
+                    self._inside = False
+                    _set_async_exc(self._thread.ident, None)
+                return
+            except Cancelled:
+                pass
+    def cancel(self):
+        """Ask the job to stop.
+
+        Cancelled is raised in the job the next time it executes Python code; 
+        a job blocked in a C call (e.g. reading a socket) ends only once that returns. 
+        Jobs that have finished or whose callable has returned are not affected. """
+        with self._lock:
+            if self.done:
+                return
+            self._cancelled = True
+            if not self._inside:
+                return
+            # a thread cannot be killed; the exception is raised 
+            # in the job as soon as it executes Python code again
+            _set_async_exc(self._thread.ident, Cancelled)
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        return self.done
+    @property
+    def done(self):
+        return self._finished is not None
+    @property
+    def cancelled(self):
+        return self._cancelled
+    @property
+    def result(self):
+        return self._result
+    @property
+    def exception(self):
+        return self._exception
+    @property
+    def duration(self):
+        if self._started is None:
+            return None
+        if self._finished is None:
+            return _time.monotonic() - self._started
+        return self._finished - self._started
@@ -0,0 +1,83 @@
+import collections as _col
+import itertools as _it
+import threading as _th
+
+
+class LogBuffer(object):
+    """A writable stream that keeps only the last maxlen lines. 
+
+    A carriage return starts its line over, as on a terminal, 
+    so progress bars do not pile up; of a line without end 
+    only the last max_line characters are kept. """
+    max_line = 1 << 16
+    def __init__(self, maxlen=10_000):
+        self._lines = _col.deque(maxlen=maxlen)
+        self._chunks = list() # the line that is not complete yet
+        self._size = 0 # sum of the lengths of the chunks
+        self._return = False # whether the chunks end in a carriage return
+        self._count = 0 # number of complete lines ever written
+        self._lock = _th.Lock()
+    @property
+    def maxlen(self):
+        return self._lines.maxlen
+    @property
+    def count(self):
+        return self._count
+    def write(self, text):
+        with self._lock:
+            *lines, last = text.split('\n')
+            for line in lines:
+                self._extend(line)
+                self._lines.append(self._partial())
+                self._count += 1
+                self._chunks = list()
+                self._size = 0
+                self._return = False
+            self._extend(last)
+        return len(text)
+    def _extend(self, text):
+        if not len(text):
+            return
+        if self._return:
+            self._chunks = list()
+            self._size = 0
+        body = text.rstrip('\r')
+        # a carriage return right before the newline ends the line as well
+        self._return = len(body) < len(text)
+        if '\r' in body:
+            self._chunks = list()
+            self._size = 0
+            body = body.rpartition('\r')[2]
+        if not len(body):
+            return
+        self._chunks.append(body)
+        self._size += len(body)
+        if self._size > 2 * self.max_line:
+            self._chunks = [self._partial()]
+            self._size = len(self._chunks[0])
+    def _partial(self):
+        return ''.join(self._chunks)[-self.max_line:]
+    def flush(self):
+        pass
+    def isatty(self):
+        return False
+    def writable(self):
+        return True
+    def read(self, position=0):
+        """Return the complete lines from position onwards 
+        that are still held together with the next position. """
+        with self._lock:
+            first = self._count - len(self._lines)
+            start = max(position, first) - first
+            lines = list(_it.islice(self._lines, start, None))
+            return lines, self._count
+    def tail(self, n):
+        with self._lock:
+            lines = list(self._lines)
+            partial = self._partial()
+            if partial:
+                lines.append(partial)
+        return lines[max(0, len(lines) - n):]
+    def getvalue(self):
+        with self._lock:
+            return '\n'.join(list(self._lines) + [self._partial()])
@@ -0,0 +1,106 @@
+"""On-disk cache of resolved knot trees. 
+
+A manifest holds everything make() derives through introspection 
+of a single knot; the mains of an uncallable have manifests 
+of their own, stored under the command path that leads to them, 
+so a warm start reads only the knots along that path. 
+A manifest is stored together with the paths, modification times 
+and sizes of the source files that define the value 
+and it is only used while the value is still defined by them, unchanged. 
+Only modules and the classes and functions defined in source files 
+are cached; instances, partials and the like can differ between runs 
+without any file changing, so they (and everything below them) 
+are introspected every time. """
+
+import inspect as _ins
+import os as _os
+import pickle as _pickle
+import tempfile as _tmp
+
+VERSION = 4
+
+
+def cacheable(value):
+    if _ins.ismodule(value):
+        pass
+    elif _ins.isclass(value) or _ins.isfunction(value):
+        # functions and classes made inside of functions share their names
+        if '<' in value.__qualname__:
+            return False
+    else:
+        return False
+    return len(source_files(value)) > 0
+
+def source_files(value):
+    """The source files that define value; 
+    for a class, those of its bases as well. """
+    if _ins.isclass(value):
+        objs = value.__mro__
+    else:
+        objs = [value]
+    ans = set()
+    for obj in objs:
+        try:
+            file = _ins.getsourcefile(obj)
+        except TypeError:
+            continue # e.g. builtins
+        if file is not None:
+            ans.add(file)
+    return ans
+
+def prefix(directory, value):
+    """The prefix of the manifest of the root knot made from value, 
+    which has to be cacheable; 
+    the manifest of its main NAME has the prefix os.path.join(prefix, NAME). """
+    if _ins.ismodule(value):
+        name = value.__name__
+    else:
+        name = f"{value.__module__}.{value.__qualname__}"
+    return _os.path.join(directory, name)
+
+def path(prefix):
+    return prefix + '.manifest.pickle'
+
+def load(prefix, value, *, return_details):
+    """Return the cached manifest of value or None if there is no fresh one. """
+    try:
+        with open(path(prefix), 'rb') as stream:
+            data = _pickle.load(stream)
+    except Exception:
+        return None
+    if data.get('version') != VERSION:
+        return None
+    if data['return_details'] != return_details:
+        return None
+    if data['sources'] != _stats(source_files(value)):
+        return None
+    return data['manifest']
+
+def dump(prefix, value, knot, *, return_details):
+    data = {
+        'version': VERSION,
+        'return_details': return_details,
+        'sources': _stats(source_files(value)),
+        'manifest': knot.manifest(),
+    }
+    try:
+        content = _pickle.dumps(data)
+    except Exception:
+        return # e.g. lambdas as types; such interfaces are not cached
+    directory = _os.path.dirname(prefix)
+    _os.makedirs(directory, exist_ok=True)
+    fd, tmp = _tmp.mkstemp(dir=directory)
+    with open(fd, 'wb') as stream:
+        stream.write(content)
+    _os.replace(tmp, path(prefix))
+
+def _stats(files):
+    ans = dict()
+    for file in files:
+        try:
+            stat = _os.stat(file)
+        except OSError:
+            ans[file] = None
+        else:
+            ans[file] = (stat.st_mtime_ns, stat.st_size)
+    return ans
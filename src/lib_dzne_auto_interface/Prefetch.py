@@ -0,0 +1,84 @@
+"""Loading File-typed arguments concurrently.
+
+argparse turns the paths of File-typed arguments into
+lib_dzne_filedata File objects, which are only read once
+the called function asks for it via load().
+When a call receives several of them, all loads are started
+on a thread pool after parsing; the first load() without
+keyword arguments then returns the data read in the background.
+Errors are raised by that load() call, just as without prefetching,
+and loads that have not started when the call returns are dropped.
+
+Prefetching pays off where reading blocks (network shares, cold caches); 
+files in the page cache are parsed under the GIL and only get slower, 
+hence it is off unless lib_dzne_auto_interface.prefetch_workers is set. """
+
+import concurrent.futures as _futures
+import contextvars as _cv
+import sys as _sys
+
+import lib_dzne_auto_interface.Timing as _Timing
+
+_classes = list()
+
+
+def _file_class():
+    if not len(_classes):
+        import lib_dzne_filedata as _fd
+        base = type(_fd.TXTData.File(None))
+        class PrefetchedFile(base):
+            def load(self, /, **kwargs):
+                future, self._future = self._future, None
+                if len(kwargs) or (future is None) or future.cancel():
+                    return super().load(**kwargs)
+                return future.result()
+        _classes.append((base, PrefetchedFile))
+    return _classes[0]
+
+def _timed_load(load, file):
+    with _Timing.phase('load'):
+        return load(file)
+
+
+class Session(object):
+    """Prefetches the File objects among the values passed to wrap. """
+    def __init__(self, *, workers):
+        self._workers = workers
+        self._executor = None
+        self._files = list()
+        # without lib_dzne_filedata there cannot be any File objects
+        if workers <= 0 or 'lib_dzne_filedata' not in _sys.modules.keys():
+            self._base = None
+        else:
+            self._base, self._cls = _file_class()
+    def wrap(self, value):
+        """Return value with its File objects (also inside of lists and tuples) replaced. """
+        base = self._base
+        if base is None:
+            return value
+        if type(value) is base:
+            return self._prefetched(value)
+        if type(value) in (list, tuple) and any(type(x) is base for x in value):
+            return type(value)(self._prefetched(x) if type(x) is base else x for x in value)
+        return value
+    def _prefetched(self, file):
+        ans = object.__new__(self._cls)
+        vars(ans).update(vars(file))
+        ans._future = None
+        self._files.append(ans)
+        return ans
+    def start(self):
+        if len(self._files) < 2:
+            return # nothing to overlap
+        self._executor = _futures.ThreadPoolExecutor(
+            max_workers=min(self._workers, len(self._files)),
+        )
+        for file in self._files:
+            # a context may only be entered by one thread at a time
+            context = _cv.copy_context()
+            file._future = self._executor.submit(context.run, _timed_load, self._base.load, file)
+        self._files.clear()
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
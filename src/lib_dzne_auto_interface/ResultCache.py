@@ -0,0 +1,303 @@
+"""Memoizing the return files of callables on disk.
+
+Once enabled, a call whose return value goes into a file is looked up
+by a key made of the qualified name and source of the callable,
+the parsed argument values, the type of the return file and the
+contents (or, with file_keys='stat', path, mtime and size)
+of all File-typed inputs. On a hit the stored return file is copied
+to the requested path and the callable is not called;
+run_dictionary then returns None. Restored files get the permissions
+a new file gets from the umask, and an existing file is never replaced.
+
+With link=True the return file is a hard link to the stored entry instead,
+so that editing it in place edits the entry as well;
+the content of an entry is therefore checked against its hash
+on every hit and a changed entry is dropped.
+
+Only the return file is restored; other side effects are not,
+and neither are changes to globals or helpers the source does not show.
+An index in the store keeps size, hash and last use of every entry
+together with the counters of hits, misses and evictions;
+the store is bounded by max_bytes and evicts the least recently used
+entries first. Calls with arguments that have no stable
+representation are not cached. """
+
+import hashlib as _hashlib
+import inspect as _ins
+import json as _json
+import os as _os
+import shutil as _shutil
+import sqlite3 as _sqlite
+import sys as _sys
+import time as _time
+
+import lib_dzne_auto_interface as _lib
+import lib_dzne_auto_interface.Files as _Files
+
+
+def enable(directory, *, max_bytes=1 << 30, file_keys='content', link=False):
+    """Set lib_dzne_auto_interface.result_cache to a new Store. """
+    _lib.result_cache = Store(directory, max_bytes=max_bytes, file_keys=file_keys, link=link)
+    return _lib.result_cache
+
+def disable():
+    _lib.result_cache = None
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class Store(object):
+    def __init__(self, directory, *, max_bytes=1 << 30, file_keys='content', link=False):
+        if file_keys not in ('content', 'stat'):
+            raise ValueError(f"{file_keys!r} is not a valid value for file_keys; use 'content' or 'stat'. ")
+        self._directory = _os.path.abspath(directory)
+        self._objects = _os.path.join(self._directory, 'objects')
+        self._max_bytes = max_bytes
+        self._file_keys = file_keys
+        self._link = link
+        self._sources = dict() # callable -> hash of its source
+        self._digests = dict() # (path, mtime_ns, size, inode) -> hash of the content
+        self._index = _os.path.join(self._directory, 'index.sqlite')
+        _os.makedirs(self._objects, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+    @property
+    def directory(self):
+        return self._directory
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+    def key(self, func, dictionary, outfile):
+        """The key of a call, or None if it cannot be cached. """
+        try:
+            data = [
+                f"{func.__module__}.{func.__qualname__}",
+                self._source_hash(func),
+                f"{outfile.fileDataType.__module__}.{outfile.fileDataType.__qualname__}",
+                outfile.ext,
+                sorted([k, self._encode(v)] for k, v in dictionary.items()),
+            ]
+        except _Uncacheable:
+            return None
+        text = _json.dumps(data, sort_keys=True)
+        return _hashlib.sha256(text.encode()).hexdigest()
+    def restore(self, key, outfile):
+        """Put the stored return file of key at outfile; False on a miss. """
+        name = key + outfile.ext
+        file = str(outfile)
+        with self._connect() as connection:
+            row = connection.execute("SELECT digest FROM entries WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            self._count('misses')
+            return False
+        if _os.path.exists(file):
+            raise FileExistsError(f"The file {file.__repr__()} already exists. ")
+        digest, = row
+        entry = self._entry(name)
+        try:
+            if self._link:
+                hit = self._link_to(entry, file, digest)
+            else:
+                hit = self._copy_to(entry, file)
+        except FileNotFoundError:
+            # evicted by another process in the meantime
+            hit = False
+        if not hit:
+            self._drop(name)
+            self._count('misses')
+            return False
+        with self._connect() as connection:
+            connection.execute("UPDATE entries SET used = ? WHERE name = ?", (_time.time_ns(), name))
+            connection.execute(_INCREMENT, ('hits',))
+        return True
+    def store(self, key, outfile):
+        name = key + outfile.ext
+        with self._connect() as connection:
+            known = connection.execute("SELECT 1 FROM entries WHERE name = ?", (name,)).fetchone()
+        if known is not None:
+            return
+        entry = self._entry(name)
+        _os.makedirs(_os.path.dirname(entry), exist_ok=True)
+        tmp, digest = self._copy(str(outfile), entry)
+        _os.replace(tmp, entry)
+        size = _os.path.getsize(entry)
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            inserted = connection.execute(
+                "INSERT OR IGNORE INTO entries (name, size, digest, used) VALUES (?, ?, ?, ?)",
+                (name, size, digest, _time.time_ns()),
+            ).rowcount
+            if inserted:
+                connection.execute(_INCREMENT_BY, (size, 'bytes'))
+            total = _counter(connection, 'bytes')
+        if total > self._max_bytes:
+            self.evict()
+    def evict(self):
+        """Drop the least recently used entries until the store fits max_bytes. """
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            total = _counter(connection, 'bytes')
+            names = list()
+            for name, size in connection.execute("SELECT name, size FROM entries ORDER BY used"):
+                if total <= self._max_bytes:
+                    break
+                names.append(name)
+                total -= size
+            for name in names:
+                self._remove(connection, name)
+                connection.execute(_INCREMENT, ('evictions',))
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM entries")
+            connection.execute("UPDATE counters SET value = 0 WHERE name = 'bytes'")
+            _shutil.rmtree(self._objects, ignore_errors=True)
+            _os.makedirs(self._objects, exist_ok=True)
+    def stats(self):
+        """Hits, misses and evictions so far (over all processes)
+        and the current number and size of entries. """
+        with self._connect() as connection:
+            entries, = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+            return {
+                'hits': _counter(connection, 'hits'),
+                'misses': _counter(connection, 'misses'),
+                'evictions': _counter(connection, 'evictions'),
+                'entries': entries,
+                'bytes': _counter(connection, 'bytes'),
+            }
+    def _connect(self):
+        # a connection per operation, so that threads and processes can share the store
+        connection = _sqlite.connect(self._index, timeout=60, isolation_level=None)
+        return _Connection(connection)
+    def _count(self, counter):
+        with self._connect() as connection:
+            connection.execute(_INCREMENT, (counter,))
+    def _drop(self, name):
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._remove(connection, name)
+    def _remove(self, connection, name):
+        row = connection.execute("SELECT size FROM entries WHERE name = ?", (name,)).fetchone()
+        if row is not None:
+            connection.execute("DELETE FROM entries WHERE name = ?", (name,))
+            connection.execute(_INCREMENT_BY, (-row[0], 'bytes'))
+        try:
+            _os.remove(self._entry(name))
+        except FileNotFoundError:
+            pass
+    def _entry(self, name):
+        return _os.path.join(self._objects, name[:2], name)
+    def _copy_to(self, entry, file):
+        tmp, digest = self._copy(entry, file)
+        _Files.publish(tmp, file)
+        return True
+    def _link_to(self, entry, file, digest):
+        if _digest(entry) != digest:
+            # a linked return file was edited in place
+            return False
+        try:
+            _os.link(entry, file)
+        except FileExistsError:
+            raise FileExistsError(f"The file {file.__repr__()} already exists. ") from None
+        except OSError:
+            # file systems without hard links
+            return self._copy_to(entry, file)
+        return True
+    @staticmethod
+    def _copy(source, target):
+        """Copy source to a new file next to target; returns its path and the hash of the content. """
+        fd, tmp = _Files.temporary(target)
+        digest = _hashlib.sha256()
+        try:
+            with open(fd, 'wb') as output, open(source, 'rb') as stream:
+                for chunk in iter(lambda: stream.read(1 << 20), b""):
+                    digest.update(chunk)
+                    output.write(chunk)
+        except BaseException:
+            _os.remove(tmp)
+            raise
+        return tmp, digest.hexdigest()
+    def _source_hash(self, func):
+        if func not in self._sources.keys():
+            try:
+                source = _ins.getsource(func)
+            except (OSError, TypeError):
+                raise _Uncacheable() from None
+            self._sources[func] = _hashlib.sha256(source.encode()).hexdigest()
+        return self._sources[func]
+    def _encode(self, value):
+        if (value is None) or (type(value) in (bool, int, float, str)):
+            return [type(value).__name__, value]
+        if type(value) in (list, tuple):
+            return [type(value).__name__, [self._encode(x) for x in value]]
+        if type(value) is dict:
+            items = [[self._encode(k), self._encode(v)] for k, v in value.items()]
+            return ['dict', sorted(items, key=_json.dumps)]
+        if _is_file(value):
+            return ['file', self._file_key(str(value))]
+        text = repr(value)
+        if ' at 0x' in text:
+            raise _Uncacheable()
+        return ['repr', f"{type(value).__module__}.{type(value).__qualname__}", text]
+    def _file_key(self, path):
+        if path == "":
+            return None
+        path = _os.path.abspath(path)
+        try:
+            stat = _os.stat(path)
+        except FileNotFoundError:
+            return ['missing', path]
+        if self._file_keys == 'stat':
+            return [path, stat.st_mtime_ns, stat.st_size]
+        identity = (path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if identity not in self._digests.keys():
+            self._digests[identity] = _digest(path)
+        return self._digests[identity]
+
+
+class _Connection(object):
+    """Commits (or rolls back) an open transaction and closes the connection on exit. """
+    def __init__(self, connection):
+        self._connection = connection
+    def __enter__(self):
+        return self._connection
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._connection.in_transaction:
+                self._connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            self._connection.close()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (name TEXT PRIMARY KEY, size INTEGER, digest TEXT, used INTEGER);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER);
+INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0), ('evictions', 0), ('bytes', 0);
+"""
+_INCREMENT = "UPDATE counters SET value = value + 1 WHERE name = ?"
+_INCREMENT_BY = "UPDATE counters SET value = value + ? WHERE name = ?"
+
+def _counter(connection, name):
+    return connection.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+
+def _digest(path):
+    digest = _hashlib.sha256()
+    with open(path, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_file_classes = list()
+
+def _is_file(value):
+    # without lib_dzne_filedata there cannot be any File objects
+    if 'lib_dzne_filedata' not in _sys.modules.keys():
+        return False
+    if not len(_file_classes):
+        import lib_dzne_filedata as _fd
+        _file_classes.append(type(_fd.TXTData.File(None)))
+    return isinstance(value, _file_classes[0])
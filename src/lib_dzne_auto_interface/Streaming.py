@@ -0,0 +1,70 @@
+"""Writing iterator results to their file row by row. 
+
+A callable that returns an iterator (e.g. a generator) 
+into a file type with a registered row formatter 
+has its rows written while they are produced; 
+the complete result is never held in memory. """
+
+import collections.abc as _abc
+import os as _os
+
+import lib_dzne_auto_interface.Files as _Files
+
+chunk_size = 1 << 20 # bytes buffered between writes
+
+_formatters = dict() # registered by users
+_defaults = dict() # built in; filled on first use
+
+
+def register(fileDataType, formatter):
+    """Stream fileDataType (and its subclasses) with formatter, 
+    which turns a single row into the text written for it. """
+    _formatters[fileDataType] = formatter
+
+def formatter(fileDataType):
+    if not len(_defaults):
+        _load_defaults()
+    for cls in fileDataType.__mro__:
+        for table in (_formatters, _defaults):
+            if cls in table.keys():
+                return table[cls]
+    return None
+
+def streamable(result, fileDataType):
+    if not isinstance(result, _abc.Iterator):
+        return False
+    return formatter(fileDataType) is not None
+
+def write(outfile, rows):
+    """Write rows to outfile atomically. 
+
+    The rows go into a temporary file next to the target, 
+    which takes its place once the last row was written; 
+    see Files. """
+    file = str(outfile)
+    if file == "":
+        for row in rows:
+            pass
+        return
+    outfile.fileDataType.check_ext(file)
+    if _os.path.exists(file):
+        raise FileExistsError(f"The file {file.__repr__()} already exists. ")
+    format_row = formatter(outfile.fileDataType)
+    fd, tmp = _Files.temporary(file)
+    try:
+        with open(fd, 'w', buffering=chunk_size) as stream:
+            for row in rows:
+                stream.write(format_row(row))
+    except BaseException:
+        _os.remove(tmp)
+        raise
+    _Files.publish(tmp, file)
+
+
+def _load_defaults():
+    import lib_dzne_filedata as _fd
+    _defaults[_fd.TXTData] = _txt_row
+
+def _txt_row(row):
+    # the same text TXTData.save writes for this line
+    return f"{row}\n"
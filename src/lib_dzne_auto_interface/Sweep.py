@@ -0,0 +1,178 @@
+"""Running one knot over a grid of argument values.
+
+A sweep is given as a template and the values to try.
+The template is either a list of command line words
+(or the words of the GUI fields) with placeholders like {threshold},
+or a dictionary as accepted by run_dictionary whose keys are swept.
+The combinations form the cartesian product of the values or,
+with mode 'zip', are taken side by side.
+{index} always stands for the number of the combination. """
+
+import argparse as _ap
+import collections.abc as _abc
+import itertools as _it
+import json as _json
+import os as _os
+import re as _re
+import sys as _sys
+import tempfile as _tmp
+
+import lib_dzne_auto_interface as _lib
+import lib_dzne_auto_interface.Batch as _Batch
+
+_PLACEHOLDER = _re.compile(r"\{(\w+)\}")
+
+
+def combinations(values, *, mode='product'):
+    """Return the combinations of values (a dict of lists) as a list of dicts. """
+    names = list(values.keys())
+    lists = [list(values[x]) for x in names]
+    if mode == 'product':
+        rows = _it.product(*lists)
+    elif mode == 'zip':
+        if len(set(len(x) for x in lists)) > 1:
+            raise ValueError("All swept values must be of the same length in zip mode. ")
+        rows = zip(*lists)
+    else:
+        raise ValueError(f"{mode!r} is not a valid mode; use 'product' or 'zip'. ")
+    return [dict(zip(names, row)) for row in rows]
+
+def placeholders(combinations):
+    """The values to substitute for each combination, {index} included. """
+    return [dict(x, index=i) for i, x in enumerate(combinations)]
+
+def substitute(word, placeholders):
+    """Replace the known placeholders in word; others are kept as they are. """
+    def replace(match):
+        name = match.group(1)
+        if name in placeholders.keys():
+            return str(placeholders[name])
+        return match.group(0)
+    return _PLACEHOLDER.sub(replace, word)
+
+
+def jobs(knot, template, combinations, *, output=None):
+    """Turn the template into one job per combination.
+
+    A dictionary template gets the values of each combination;
+    the return value then goes into the path output,
+    in which the placeholders are replaced. """
+    if not isinstance(template, _abc.Mapping):
+        if output is not None:
+            raise TypeError("The output path is part of the command line words. ")
+        return [
+            [substitute(word, x) for word in template]
+            for x in placeholders(combinations)
+        ]
+    argument = None
+    if output is not None:
+        argument = _return_argument(knot, template)
+        if argument is None:
+            raise TypeError("Only a callable with a return value can write into output. ")
+    ans = list()
+    for x, y in zip(combinations, placeholders(combinations)):
+        job = dict(template, **x)
+        if argument is not None:
+            path = substitute(output, y)
+            job[argument.dest] = path if argument.type is None else argument.type(path)
+        ans.append(job)
+    return ans
+
+def _return_argument(knot, dictionary):
+    while isinstance(knot, _lib._Uncallable):
+        knot = knot.main(dictionary[knot.dest])
+    return knot.argument_of_return
+
+
+def run(knot, template, values, *, mode='product', output=None, summary=None, workers=None, executor='process'):
+    """Run every combination and return one Outcome per combination.
+
+    If summary is given, a JSON file with the values, status and timing
+    of every combination is written there once all of them are done. """
+    rows = combinations(values, mode=mode)
+    return run_jobs(
+        knot,
+        rows,
+        jobs(knot, template, rows, output=output),
+        mode=mode,
+        summary=summary,
+        workers=workers,
+        executor=executor,
+    )
+
+def run_jobs(knot, combinations, jobs, *, mode, summary=None, workers=None, executor='process'):
+    """Like run, but with the jobs of the combinations already made. """
+    outcomes = list(_Batch.run(
+        knot,
+        jobs,
+        workers=workers,
+        executor=executor,
+    ))
+    if summary is not None:
+        write_summary(summary, combinations, outcomes, mode=mode)
+    return outcomes
+
+def write_summary(file, combinations, outcomes, *, mode):
+    data = {
+        'mode': mode,
+        'combinations': [
+            {
+                'index': outcome.index,
+                'values': {k:str(v) for k, v in x.items()},
+                'ok': outcome.ok,
+                'error': None if outcome.ok else f"{type(outcome.error).__name__}: {outcome.error}",
+                'seconds': outcome.seconds,
+            }
+            for x, outcome in zip(combinations, outcomes)
+        ],
+    }
+    fd, tmp = _tmp.mkstemp(
+        dir=_os.path.dirname(_os.path.abspath(file)),
+        suffix='.json',
+    )
+    try:
+        with open(fd, 'w') as stream:
+            _json.dump(data, stream, indent=2)
+            stream.write('\n')
+        _os.replace(tmp, file)
+    except BaseException:
+        _os.remove(tmp)
+        raise
+
+
+def run_cli(knot, args):
+    """Usage: PROG --sweep NAME VALUE [VALUE ...] [--sweep ...] 
+    [--zip] [--summary FILE] [--workers N] -- ARGS ...
+
+    Runs ARGS once per combination, with {NAME} replaced by its values. """
+    if '--' not in args:
+        raise SystemExit(f"{run_cli.__doc__}\nThe words to run must follow '--'. ")
+    split = args.index('--')
+    parser = _ap.ArgumentParser(prog=f"{_os.path.basename(_sys.argv[0])} --sweep")
+    parser.add_argument('--sweep', nargs='+', action='append', required=True, metavar='NAME VALUE')
+    parser.add_argument('--zip', action='store_true')
+    parser.add_argument('--summary')
+    parser.add_argument('--workers', type=int)
+    ns = parser.parse_args(args[:split])
+    values = dict()
+    for name, *words in ns.sweep:
+        if not len(words):
+            parser.error(f"--sweep {name}: at least one value is required")
+        values[name] = words
+    outcomes = run(
+        knot,
+        args[split + 1:],
+        values,
+        mode='zip' if ns.zip else 'product',
+        summary=ns.summary,
+        workers=ns.workers,
+    )
+    if len(report_failures(outcomes)):
+        raise SystemExit(1)
+
+def report_failures(outcomes):
+    """Print the failed combinations to stderr and return them. """
+    ans = [x for x in outcomes if not x.ok]
+    for outcome in ans:
+        print(f"combination {outcome.index}: {type(outcome.error).__name__}: {outcome.error}", file=_sys.stderr)
+    return ans
@@ -0,0 +1,114 @@
+"""Timing of the phases between argv and result.
+
+Every registered hook is called as hook(phase, seconds)
+whenever one of the following phases ends:
+
+    make    introspection of a value by make()
+    parser  building the argparse parser of a knot
+    parse   parsing argv (argparse converts the values here)
+    gather  collecting the call arguments from the dictionary
+    call    the call of the wrapped function
+    load    reading a File-typed argument in the background
+    save    saving (or streaming) the result into its outfile
+    cache   looking up or storing the result in the ResultCache
+
+Phases may nest: subcommands are made and their parsers
+built on demand, i.e. inside of the parse phase.
+Hooks see the phases of every thread; a Recorder only sees those 
+of its own context, i.e. of the run it was entered in 
+(and of the thread pools that run parts of it, like Batch and Prefetch), 
+so concurrent runs under the daemon or the GUI are kept apart. 
+Without hooks or recorders no time is taken. """
+
+import contextlib as _ctx
+import contextvars as _cv
+import sys as _sys
+import threading as _th
+import time as _time
+
+_hooks = tuple() # replaced as a whole, so phase reads it without the lock
+_lock = _th.Lock()
+_recorders = _cv.ContextVar('recorders', default=tuple())
+
+
+def add_hook(hook):
+    global _hooks
+    with _lock:
+        _hooks = _hooks + (hook,)
+
+def remove_hook(hook):
+    global _hooks
+    with _lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+def log(phase, seconds):
+    """A hook that sends the phases to logging at level DEBUG. """
+    import logging as _logging
+    _logging.getLogger(__name__).debug("%s took %.6f s", phase, seconds)
+
+@_ctx.contextmanager
+def phase(name):
+    hooks = _hooks + _recorders.get()
+    if not len(hooks):
+        yield
+        return
+    start = _time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = _time.perf_counter() - start
+        for hook in hooks:
+            hook(name, seconds)
+
+
+class Recorder(object):
+    """Sums up the phases of the current context while it is entered. """
+    def __init__(self):
+        self.totals = dict()
+        self.counts = dict()
+        self.seconds = None
+        self._lock = _th.Lock() # pool threads of the same run report as well
+    def __call__(self, phase, seconds):
+        with self._lock:
+            self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+    def __enter__(self):
+        self._token = _recorders.set(_recorders.get() + (self,))
+        self._start = _time.perf_counter()
+        return self
+    def __exit__(self, *exc_info):
+        self.seconds = _time.perf_counter() - self._start
+        _recorders.reset(self._token)
+    def report(self):
+        lines = [f"{'phase':<8} {'count':>6} {'seconds':>12}"]
+        for name, seconds in self.totals.items():
+            lines.append(f"{name:<8} {self.counts[name]:>6} {seconds:>12.6f}")
+        if self.seconds is not None:
+            lines.append(f"{'total':<8} {'':>6} {self.seconds:>12.6f}")
+        return "\n".join(lines)
+
+
+def profile(func, /, *, file=None, stream=None):
+    """Call func and print its phase breakdown to stream (stderr).
+
+    If file is given, the complete call is also run
+    under cProfile and its statistics are dumped into file. """
+    if stream is None:
+        stream = _sys.stderr
+    if file is None:
+        profiler = None
+    else:
+        import cProfile as _cProfile
+        profiler = _cProfile.Profile()
+    recorder = Recorder()
+    try:
+        with recorder:
+            if profiler is None:
+                return func()
+            return profiler.runcall(func)
+    finally:
+        print(recorder.report(), file=stream)
+        if profiler is not None:
+            profiler.dump_stats(file)
@@ -1,54 +1,57 @@
 import argparse as _ap
-import contextlib as _ctx
 import inspect as _ins
 import os as _os
-import tempfile as _tmp
-import tkinter as _tk
-import tkinter.messagebox as _msg
-import tkinter.ttk as _ttk
+import sys as _sys
 
-import lib_dzne_filedata as _fd
-
-import lib_dzne_auto_interface.gui.HelpButton as _HB
-import lib_dzne_auto_interface.gui.inputs as _inputs
-import lib_dzne_auto_interface.gui.Stack as _Stack
+import lib_dzne_auto_interface.ArgumentSpec as _ArgumentSpec
 import lib_dzne_auto_interface.Information as _Info
+import lib_dzne_auto_interface.Timing as _Timing
 
 
-class _KnotFrame(_tk.Frame):
-    @property
-    def knot(self):
-        return self._knot
-    def __init__(self, master, *, knot, **kwargs):
-        super().__init__(master)
-        self._knot = knot
-        self._init(**kwargs)
-    def parse(self):
-        raise NotImplementedError
+# settings for every _Callable run; 
+# the modules named are only imported when a setting asks for them
+result_cache = None # a ResultCache.Store, or None; see ResultCache.enable
+isolation = None # an Isolation.Policy, or None; see Isolation.enable
+prefetch_workers = 0 # threads per call that load File arguments; see Prefetch
 
 
 class _Knot(object):
-    def _make_parser(self, *args, **kwargs):
-        return _ap.ArgumentParser(
-            *args,
-            **kwargs,
-            add_help=False,
-        )
-    def parser(self, *, add_help):
-        return _ap.ArgumentParser(
-            add_help=add_help,
-            parents=[self._parser],
-            description=self._parser.description,
-        )
-    def parse(self, args, *, add_help=False):
+    def parser(self, *, add_help, prog=None):
+        # knots are never altered after construction, 
+        # so the compiled parsers live as long as the knot itself
+        key = (bool(add_help), prog)
+        cache = vars(self).setdefault('_parser_cache', dict())
+        if key not in cache:
+            with _Timing.phase('parser'):
+                ans = _ap.ArgumentParser(
+                    prog=prog,
+                    add_help=add_help,
+                    description=self.description,
+                )
+                self._add_arguments(ans)
+            cache[key] = ans
+        return cache[key]
+    def _add_arguments(self, parser):
+        for subknot in self.subknots:
+            subknot._add_arguments(parser)
+    def _defines_option(self, option_string):
+        return any(x._defines_option(option_string) for x in self.subknots)
+    def parse(self, args, *, add_help=False, prog=None):
         parser = self.parser(
             add_help=add_help, 
+            prog=prog,
         )
-        namespace = parser.parse_args(args)
+        with _Timing.phase('parse'):
+            namespace = parser.parse_args(args)
         ans = vars(namespace)
         return ans
+    def parse_many(self, argvs, *, add_help=False):
+        return [self.parse(args, add_help=add_help) for args in argvs]
     def frame(self, master):
-        return type(self)._Frame(master=master, knot=self)
+        # the GUI layer (and tkinter with it) is only loaded on demand
+        import lib_dzne_auto_interface.gui.frames as _frames
+        cls = getattr(_frames, self._frame_name)
+        return cls(master=master, knot=self)
     @staticmethod
     def _details_from_annotation(annotation):
         if annotation is _ins.Parameter.empty:
@@ -61,174 +64,86 @@ class _Knot(object):
     @property
     def subknots(self):
         return list(self._subknots)
+    @property
+    def description(self):
+        return None
 
 class _Argument(_Knot):
-    class _Frame(_KnotFrame):
-        @property
-        def changed_argument(self):
-            ans = self.knot
-            ans = ans.change(help=None)
-            return ans
-        def _init(self):
-            self._labelFrame = self._add_labelFrame()
-            self._helpButton = self._add_helpButton()
-            self._argumentInput = self._add_argumentInput()
-        def parse(self):
-            args = self._argumentInput.get_args()
-            kwargs = self.knot.parse(args)
-            return kwargs
-        def _add_labelFrame(self):
-            ans = _tk.LabelFrame(
-                self, 
-                text=self.knot.dest,
-            )
-            ans.pack(fill='both', expand=True)
-            return ans
-        def _add_helpButton(self):
-            if self.knot.help is None:
-                return None
-            ans = _HB.HelpButton(
-                self._labelFrame,
-                title=f"help: {self.knot.dest}",
-                message=self.knot.help,
-            )
-            ans.pack(
-                side='right',
-                #fill='y',
-                padx=10,
-                pady=10,
-            )
-            return ans
-        def _add_argumentInput(self):
-            ans = _inputs.ArgumentInput(
-                self._labelFrame, 
-                argument=self.changed_argument,
-            )
-            ans.pack(
-                padx=10,
-                pady=10,
-                side='left',
-                fill='both',
-                expand=True,
-            )
-            return ans
+    _frame_name = 'ArgumentFrame'
+    _keys = frozenset(_ArgumentSpec.ArgumentSpec.__slots__)
     def __init__(self, *args, **kwargs):
-        self._subknots = list() # an argument cannot have subknots
         dictionary = dict(*args, **kwargs)
-        for key in dictionary.keys():
-            if key not in self.keys():
-                raise KeyError(key)
-        info = _Info.Information(kwargs=dictionary)
-
-        # option_strings
-        info.args = info.pop('option_strings', [])
-
-        # of_return
-        of_return = info.pop('of_return', False)
-        self._of_return = bool(of_return)
-
-        # required
-        if bool(info.pop('required', False)):
-            info['required'] = True
-
-        # help
-        Help = type(info.get('help', None))
-        if Help not in (type(None), str):
-            raise TypeError(f"{Help.__name__} is not a valid type for the parameter 'help'. ")
-
-        # nargs
-        Nargs = type(info.get('nargs', None))
-        if Nargs not in (type(None), str, int):
-            raise TypeError(f"{Nargs.__name__} is not a valid type for the parameter 'nargs'. ")
-
-        # action
-        info['action'] = info.get('action', 'store')
-        self._action_string = info['action']
-        if self._action_string not in (
-            'store', 
-            'store_true', 
-            'store_false', 
-            #'store_const',
-            #'append',
-            #'append_const',
-        ):
-            raise ValueError()
-
-        self._parser = self._make_parser()
-        self._action = info.exec(self._parser.add_argument)
+        self._init(_ArgumentSpec.ArgumentSpec.make(dictionary))
+    def _init(self, spec):
+        self._subknots = list() # an argument cannot have subknots
+        self._spec = spec
+    @classmethod
+    def _from_spec(cls, spec):
+        ans = object.__new__(cls)
+        ans._init(spec)
+        return ans
+    def _add_arguments(self, parser):
+        self._spec.add_to(parser)
+    def _defines_option(self, option_string):
+        return option_string in self.option_strings
     def __getitem__(self, key):
-        if key not in self.keys():
+        if key not in self._keys:
             raise KeyError(key)
-        if key == 'action':
-            return self._action_string
-        if key == 'of_return':
-            return self._of_return
-        if key == 'option_strings':
-            return tuple(self._action.option_strings)
-        return getattr(self._action, key)
+        return getattr(self._spec, key)
     @classmethod
     def keys(cls):
-        return [
-            'option_strings',
-            'action',
-            'dest',
-            'nargs',
-            'const',
-            'default',
-            'type',
-            'choices',
-            'required',
-            'help',
-            'of_return',
-        ]
+        return list(_ArgumentSpec.ArgumentSpec.__slots__)
     def items(self):
         for key in self.keys():
             yield key, self[key]
     def to_dict(self):
-        return dict(self.items())
+        return self._spec.to_dict()
     def change(self, **kwargs):
-        dictionary = self.to_dict()
-        for key, value in kwargs.items():
-            dictionary[key] = value
-        cls = type(self)
-        ans = cls(dictionary)
-        return ans
+        return self._from_spec(self._spec.replace(**kwargs))
+    @property
+    def spec(self):
+        return self._spec
     @property
     def positional(self):
-        return not bool(len(self.option_strings))
+        return self._spec.positional
     @property
     def action(self):
-        return self['action']
+        return self._spec.action
     @property
     def option_strings(self):
-        return self['option_strings']
+        return self._spec.option_strings
     @property
     def dest(self):
-        return self['dest']
+        return self._spec.dest
     @property
     def nargs(self):
-        return self['nargs']
+        return self._spec.nargs
     @property
     def const(self):
-        return self['const']
+        return self._spec.const
     @property
     def default(self):
-        return self['default']
+        return self._spec.default
     @property
     def type(self):
-        return self['type']
+        return self._spec.type
     @property
     def choices(self):
-        return self['choices']
+        return self._spec.choices
     @property
     def required(self):
-        return self['required']
+        return self._spec.required
     @property
     def help(self):
-        return self['help']
+        return self._spec.help
     @property
     def of_return(self):
-        return self['of_return']
+        return self._spec.of_return
+    def manifest(self):
+        return self._spec.to_dict()
+    @classmethod
+    def _from_manifest(cls, manifest):
+        return cls._from_spec(_ArgumentSpec.ArgumentSpec(**manifest))
     @classmethod
     def argument_of_return(cls, annotation, *, details={}):
         if annotation is _ins.Parameter.empty:
@@ -237,41 +152,49 @@ class _Argument(_Knot):
         return _Argument(**ann, of_return=True, **details)
 
 class _Parameter(_Knot):
-    class _Frame(_KnotFrame):
-        def _init(self):
-            self.stack = self._add_stack()
-        def parse(self):
-            ans = dict()
-            for level in self.stack.levels:
-                kwargs = level.parse()
-                ans = dict(**ans, **kwargs)
-            return ans
-        def _add_stack(self):
-            factories = [x.frame for x in self.knot.subknots]
-            ans = _Stack.Stack(self, factories=factories)
-            ans.pack(
-                expand=True,
-                fill='both',
-            )
-            return ans
+    _frame_name = 'ParameterFrame'
     def __init__(self, value):
-        self._subknots = self._get_subknots(value)
-        parents = [x.parser(add_help=False) for x in self._subknots]
-        self._parser = self._make_parser(parents=parents)
-        self._kind = value.kind
+        self._init(
+            subknots=self._get_subknots(value), 
+            kind=value.kind,
+        )
         #self.information({x:None for x in self.dests})
+    def _init(self, *, subknots, kind):
+        self._subknots = subknots
+        self._kind = kind
+    def manifest(self):
+        return {
+            'kind': self.kind.name,
+            'arguments': [x.manifest() for x in self.subknots],
+        }
+    @classmethod
+    def _from_manifest(cls, manifest):
+        ans = object.__new__(cls)
+        ans._init(
+            subknots=[_Argument._from_manifest(x) for x in manifest['arguments']],
+            kind=getattr(_ins.Parameter, manifest['kind']),
+        )
+        return ans
     def information(self, kwargs, /):
+        builder = _Info.Builder()
+        self.gather(builder, kwargs)
+        return builder.freeze()
+    def gather(self, builder, kwargs, /):
         if set(kwargs.keys()) != set(self.dests):
             raise KeyError()
         if self.kind is _ins.Parameter.VAR_KEYWORD:
-            return _Info.Information(kwargs=kwargs)
+            builder.update(kwargs)
+            return
         dest, = self.dests
         if self.kind is _ins.Parameter.KEYWORD_ONLY:
-            return _Info.Information(kwargs=kwargs)
+            builder.update(kwargs)
+            return
         if self.kind is _ins.Parameter.VAR_POSITIONAL:
-            return _Info.Information(args=kwargs[dest])
+            builder.extend(kwargs[dest])
+            return
         if self.kind is _ins.Parameter.POSITIONAL_ONLY:
-            return _Info.Information(args=[kwargs[dest]])
+            builder.append(kwargs[dest])
+            return
         raise ValueError()
     @property
     def dests(self):
@@ -318,9 +241,30 @@ class _Parameter(_Knot):
 
 class _Main(_Knot):
     def run_cli(self, args):
+        """A leading '--profile' (or '--profile=FILE') option 
+        prints the phase breakdown to stderr 
+        (and dumps cProfile statistics into FILE) 
+        unless the knot defines '--profile' itself. """
+        args = list(args)
+        if len(args) and (args[0] == '--profile' or args[0].startswith('--profile=')):
+            if not self._defines_option('--profile'):
+                file = args.pop(0).partition('=')[2] or None
+                _Timing.profile(lambda: self.run_cli(args), file=file)
+                return
+        if len(args) and args[0] == '--sweep':
+            if not self._defines_option('--sweep'):
+                import lib_dzne_auto_interface.Sweep as _Sweep
+                _Sweep.run_cli(self, args)
+                return
+        if len(args) and args[0] == '--config':
+            if not self._defines_option('--config'):
+                import lib_dzne_auto_interface.Config as _Config
+                _Config.run_cli(self, args[1:])
+                return
         dictionary = self.parse(args, add_help=True)
         self._run_dictionary(dictionary)
     def run_gui(self):
+        import tkinter as _tk
         root = _tk.Tk()
         root.title("")
         frame = self.frame(root)
@@ -328,130 +272,138 @@ class _Main(_Knot):
         root.mainloop()
     def run_dictionary(self, dictionary, /):
         dictionary = dict(dictionary)
-        self._run_dictionary(dictionary)
+        return self._run_dictionary(dictionary)
+    def run_config(self, config, /, *, workers=None, executor='thread'):
+        """Run the jobs of config (a mapping or a .json/.toml file) 
+        with the argument rules applied to its values; see Config. """
+        import lib_dzne_auto_interface.Config as _Config
+        return _Config.run(self, config, workers=workers, executor=executor)
+    def completion(self, shell, *, prog):
+        """Return a static completion script for shell ('bash' or 'zsh'). """
+        import lib_dzne_auto_interface.Completion as _Completion
+        return _Completion.script(self, shell, prog=prog)
+    def serve(self, path, *, workers=4):
+        import lib_dzne_auto_interface.Daemon as _Daemon
+        _Daemon.serve(self, path, workers=workers)
+    def run_batch(self, jobs, /, *, workers=None, executor='thread', ordered=True):
+        import lib_dzne_auto_interface.Batch as _Batch
+        return _Batch.run(
+            self, 
+            jobs, 
+            workers=workers, 
+            executor=executor, 
+            ordered=ordered,
+        )
+    def run_sweep(self, template, values, /, *, mode='product', output=None, summary=None, workers=None, executor='process'):
+        """Run template (command line words or a dictionary) 
+        for every combination of values; see Sweep. """
+        import lib_dzne_auto_interface.Sweep as _Sweep
+        return _Sweep.run(
+            self, 
+            template, 
+            values, 
+            mode=mode, 
+            output=output, 
+            summary=summary, 
+            workers=workers, 
+            executor=executor,
+        )
     def _run_dictionary(self, dictionary):
         raise NotImplementedError()
-    @property
-    def description(self):
-        return self._parser.description
 
 
 class _Callable(_Main):
-    class _Frame(_KnotFrame):
-        def _init(self):
-            self.buttonFrame = self._add_buttonFrame()
-            self.helpButton = self._add_helpButton()
-            self.goButton = self._add_goButton()
-            self.stack = self._add_stack()
-        def parse(self):
-            ans = dict()
-            for level in self.stack.levels:
-                kwargs = level.parse()
-                ans = dict(**ans, **kwargs)
-            return ans
-        def go(self):
-            with _tmp.TemporaryDirectory() as directory:
-                filename = "a" + _fd.TXTData.ext()
-                errlog = _os.path.join(directory, filename)
-                with open(errlog, "w") as s, _ctx.redirect_stderr(s):
-                    self._go_except()
-                txtData = _fd.TXTData.load(errlog)
-            text = str(txtData)
-            text = text.strip('\n')
-            if len(text):
-                _msg.showwarning(
-                    title="Error Log",
-                    message=text,
-                )
-        def _go_except(self):
-            try:
-                kwargs = self.parse()
-                self.knot.run_dictionary(kwargs)
-            except BaseException as exc:
-                _msg.showerror(
-                    title=type(exc).__name__,
-                    message=str(exc),
-                )
-        def _add_buttonFrame(self):
-            ans = _tk.Frame(self)
-            ans.pack(
-                side='bottom',
-                fill='x',
-                padx=0,
-                pady=0,
-            )
-            return ans
-        def _add_helpButton(self):
-            ans = _HB.HelpButton.make(
-                self.buttonFrame,
-                title="help",
-                message=self.knot.description,
-            )
-            if ans is None:
-                return ans
-            ans.pack(
-                side='right',
-                padx=10,
-                pady=10,
-            )
-            return ans
-        def _add_goButton(self):
-            ans = _ttk.Button(
-                self.buttonFrame,
-                text="go",
-                command=self.go,
-            )
-            ans.pack(
-                side='right',
-                padx=10,
-                pady=10,
-            )
-            return ans
-        def _add_stack(self):
-            factories = [x.frame for x in self.knot.subknots]
-            ans = _Stack.Stack(self, factories=factories)
-            ans.pack(
-                side='top',
-                fill='x',
-                padx=10,
-                pady=10,
-            )
-            return ans
+    _frame_name = 'CallableFrame'
     def __init__(self, value, return_details):
-        self._value = value
         signature = _ins.signature(value)
-        self._parameters = [_Parameter(p) for n, p in signature.parameters.items()]
-        self._argument_of_return = _Argument.argument_of_return(
-            annotation=signature.return_annotation,
-            details=return_details,
-        )
-        parents = [x.parser(add_help=False) for x in self.subknots]
-        self._parser = self._make_parser(
-            description=self.description,
-            parents=parents,
+        self._init(
+            value,
+            parameters=[_Parameter(p) for n, p in signature.parameters.items()],
+            argument_of_return=_Argument.argument_of_return(
+                annotation=signature.return_annotation,
+                details=return_details,
+            ),
         )
+    def _init(self, value, *, parameters, argument_of_return):
+        self._value = value
+        self._parameters = parameters
+        self._argument_of_return = argument_of_return
     def _run_dictionary(self, dictionary):
         if self.argument_of_return is None:
             outfile = None
         else:
             outfile = dictionary.pop(self.argument_of_return.dest)
-        info = _Info.Information()
-        for p in self.parameters:
-            y = {x:dictionary.pop(x) for x in p.dests}
-            info += p.information(y)
-        if len(dictionary):
-            raise KeyError()
-        result = info.exec(self._value)
+        cache = result_cache
+        key = None
+        if (cache is not None) and (outfile is not None) and (str(outfile) != ""):
+            with _Timing.phase('cache'):
+                key = cache.key(self._value, dictionary, outfile)
+                if (key is not None) and cache.restore(key, outfile):
+                    return None
+        policy = isolation
+        prefetch = None
+        # the threads of a prefetch would not exist in an isolated child
+        if (prefetch_workers > 0) and (policy is None):
+            import lib_dzne_auto_interface.Prefetch as _Prefetch
+            prefetch = _Prefetch.Session(workers=prefetch_workers)
+        with _Timing.phase('gather'):
+            builder = _Info.Builder()
+            for p in self.parameters:
+                y = {x:dictionary.pop(x) for x in p.dests}
+                if prefetch is not None:
+                    y = {x:prefetch.wrap(v) for x, v in y.items()}
+                p.gather(builder, y)
+            if len(dictionary):
+                raise KeyError()
+        if prefetch is not None:
+            prefetch.start()
+        try:
+            with _Timing.phase('call'):
+                if policy is None:
+                    result = builder.exec(self._value)
+                else:
+                    # the child saves the return file itself, 
+                    # so that a returned iterator never has to come back
+                    result = policy.call(_exec_and_save, builder, self._value, outfile)
+        finally:
+            if prefetch is not None:
+                prefetch.close()
         if outfile is None:
-            return
-        result = outfile.fileDataType(result)
-        outfile.save(result)
+            return result
+        if policy is None:
+            with _Timing.phase('save'):
+                result = _save(result, outfile)
+        if key is not None:
+            with _Timing.phase('cache'):
+                cache.store(key, outfile)
+        return result
     @property
     def _subknots(self):
         ans = self.parameters
         if self.argument_of_return is not None:
             ans.append(self.argument_of_return)
         return ans
+    def manifest(self):
+        if self.argument_of_return is None:
+            of_return = None
+        else:
+            of_return = self.argument_of_return.manifest()
+        return {
+            'parameters': [x.manifest() for x in self.parameters],
+            'argument_of_return': of_return,
+        }
+    @classmethod
+    def _from_manifest(cls, value, manifest, *, return_details):
+        of_return = manifest['argument_of_return']
+        if of_return is not None:
+            of_return = _Argument._from_manifest(of_return)
+        ans = object.__new__(cls)
+        ans._init(
+            value,
+            parameters=[_Parameter._from_manifest(x) for x in manifest['parameters']],
+            argument_of_return=of_return,
+        )
+        return ans
     @property
     def parameters(self):
         return list(self._parameters)
@@ -463,76 +415,112 @@ class _Callable(_Main):
     def description(self):
         return self._value.__doc__
 
+def _save(result, outfile):
+    """Save result to outfile; returns result, or None if it was streamed. """
+    import lib_dzne_auto_interface.Streaming as _Streaming
+    if _Streaming.streamable(result, outfile.fileDataType):
+        _Streaming.write(outfile, result)
+        return None
+    outfile.save(outfile.fileDataType(result))
+    return result
+
+def _exec_and_save(builder, func, outfile):
+    result = builder.exec(func)
+    if outfile is None:
+        return result
+    return _save(result, outfile)
+
 class _Uncallable(_Main):
-    class _Frame(_KnotFrame):
-        def _init(self):
-            self.buttonFrame = self._add_buttonFrame()
-            self.helpButton = self._add_helpButton()
-            self.notebook = self._add_notebook()#ttk.Notebook(container,**options)
-            for name, subknot in self.knot.mains.items():
-                subframe = subknot.frame(self.notebook)
-                subframe.pack(
-                    expand=True,
-                    fill='both',
-                )
-                self.notebook.add(subframe, text=name)
-        def _add_notebook(self):
-            ans = _ttk.Notebook(self)
-            ans.pack(
-                side='top',
-                fill='both',
-                expand=True,
-                padx=10,
-                pady=10,
-            )
-            return ans
-        def _add_buttonFrame(self):
-            ans = _tk.Frame(self)
-            ans.pack(
-                side='bottom',
-                fill='x',
-                padx=0,
-                pady=0,
-            )
-            return ans
-        def _add_helpButton(self):
-            if self.knot.description is None:
-                return None
-            ans = _HB.HelpButton(
-                self.buttonFrame,
-                title="help",
-                message=self.knot.description,
-            )
-            ans.pack(
-                side='right',
-                padx=10,
-                pady=10,
-            )
+    _frame_name = 'UncallableFrame'
     def __init__(self, value, return_details):
+        attributes = [n for n, m in _ins.getmembers(value) if not n.startswith("_")]
+        self._init(
+            value,
+            attributes={n.replace('_', '-'):n for n in attributes},
+            return_details=return_details,
+        )
+    def _init(self, value, *, attributes, return_details):
+        self._value = value
         self._dest = value._dest
         self._description = value.__doc__
-        self._mains = dict()
-        parser = self._make_parser()
-        subparsers = parser.add_subparsers(dest=value._dest, required=True)
-        for n, m in _ins.getmembers(value):
-            if n.startswith("_"):
-                continue
-            name = n.replace('_', '-')
-            self._mains[name] = make(m, return_details=return_details)
-            parent = self._mains[name].parser(add_help=False)
+        self._return_details = return_details
+        self._attributes = attributes
+        self._cache = None # the manifest prefix of this knot; see _cached
+        self._mains = dict() # filled on demand by main()
+    def _add_arguments(self, parser):
+        # the complete tree is only needed for help, errors and the GUI; 
+        # the arguments go straight into the subparsers 
+        # instead of being copied from a parent parser on every level
+        subparsers = parser.add_subparsers(dest=self.dest, required=True)
+        for name, main in self.mains.items():
             subparser = subparsers.add_parser(
-                n.replace("_", "-"),
-                parents=[parent],
+                name,
                 add_help=True,
+                description=main.description,
             )
-            subparser.description = parent.description
-        self._parser = self._make_parser(
-            parents=[parser],
-            description=value.__doc__,
+            main._add_arguments(subparser)
+    def resolve(self, names):
+        """Follow the command path names as far as it leads.
+
+        Returns the knot reached and the dests along the way.
+        The mains of every level form a trie that is filled on demand; 
+        only the knots along the path are built. """
+        knot = self
+        dests = list()
+        for name in names:
+            if not (isinstance(knot, _Uncallable) and (name in knot._attributes.keys())):
+                break
+            dests.append(knot.dest)
+            knot = knot.main(name)
+        return knot, dests
+    def parse(self, args, *, add_help=False, prog=None):
+        args = list(args)
+        knot, dests = self.resolve(args)
+        if not len(dests):
+            return super().parse(args, add_help=add_help, prog=prog)
+        # only the arguments of the knot at the end of the path are parsed
+        path = args[:len(dests)]
+        if prog is None:
+            prog = _os.path.basename(_sys.argv[0])
+        ans = _Knot.parse(
+            knot,
+            args[len(dests):], 
+            add_help=True, 
+            prog=" ".join([prog] + path),
         )
+        ans.update(zip(dests, path))
+        return ans
     def _run_dictionary(self, dictionary):
-        key = dictionary.pop(self.dest)
-        return self._mains[key].run_dictionary(dictionary)
+        knot = self
+        while isinstance(knot, _Uncallable):
+            knot = knot.main(dictionary.pop(knot.dest))
+        return knot._run_dictionary(dictionary)
+    def main(self, name):
+        if name in self._mains.keys():
+            return self._mains[name]
+        value = getattr(self._value, self._attributes[name])
+        with _Timing.phase('make'):
+            if self._cache is None:
+                ans = _make(value, return_details=self._return_details)
+            else:
+                prefix = _os.path.join(self._cache, name)
+                ans = _cached(value, prefix, return_details=self._return_details)
+        self._mains[name] = ans
+        return ans
+    def manifest(self):
+        # the mains have manifests of their own
+        return {
+            'attributes': dict(self._attributes),
+        }
+    @classmethod
+    def _from_manifest(cls, value, manifest, *, return_details):
+        ans = object.__new__(cls)
+        ans._init(
+            value,
+            attributes=dict(manifest['attributes']),
+            return_details=return_details,
+        )
+        return ans
     @property
     def description(self):
         return self._description
@@ -540,16 +528,51 @@ class _Uncallable(_Main):
     def dest(self):
         return self._dest
     @property
+    def names(self):
+        return list(self._attributes.keys())
+    @property
     def mains(self):
-        return dict(self._mains)
+        return {n:self.main(n) for n in self._attributes.keys()}
     @property
     def _subknots(self):
-        return list(self._mains.values())
+        return list(self.mains.values())
+    def _defines_option(self, option_string):
+        return False # this level only holds the subcommands
 
 
 
 
         
-def make(value, *, return_details):
+def _from_manifest(value, manifest, *, return_details):
     cls = _Callable if callable(value) else _Uncallable
-    return cls(value, return_details=return_details) 
+    return cls._from_manifest(value, manifest, return_details=return_details)
+
+def make(value, *, return_details, cache=None):
+    with _Timing.phase('make'):
+        return _make(value, return_details=return_details, cache=cache)
+
+def _make(value, *, return_details, cache=None):
+    cls = _Callable if callable(value) else _Uncallable
+    if cache is None:
+        return cls(value, return_details=return_details)
+    import lib_dzne_auto_interface.Manifest as _Manifest
+    if not _Manifest.cacheable(value):
+        return cls(value, return_details=return_details)
+    return _cached(value, _Manifest.prefix(cache, value), return_details=return_details)
+
+def _cached(value, prefix, *, return_details):
+    # every knot has a manifest of its own, 
+    # so only the knots along the parsed path are read
+    import lib_dzne_auto_interface.Manifest as _Manifest
+    if not _Manifest.cacheable(value):
+        # neither it nor anything below it is cached
+        return _make(value, return_details=return_details)
+    manifest = _Manifest.load(prefix, value, return_details=return_details)
+    if manifest is None:
+        ans = _make(value, return_details=return_details)
+        _Manifest.dump(prefix, value, ans, return_details=return_details)
+    else:
+        ans = _from_manifest(value, manifest, return_details=return_details)
+    if isinstance(ans, _Uncallable):
+        ans._cache = prefix
+    return ans 
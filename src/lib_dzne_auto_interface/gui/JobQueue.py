@@ -0,0 +1,334 @@
+import collections as _col
+import itertools as _it
+import tkinter as _tk
+import tkinter.messagebox as _msg
+import tkinter.scrolledtext as _st
+import tkinter.ttk as _ttk
+
+import lib_dzne_auto_interface.Job as _Job
+import lib_dzne_auto_interface.LogBuffer as _LogBuffer
+
+
+class _Entry(object):
+    def __init__(self, func, args, *, title, log_lines):
+        self._func = func
+        self._args = args
+        self._title = title
+        self._log_lines = log_lines
+        self.reset()
+    def reset(self):
+        self._job = None
+        self._cancelled = False
+        self._log = _LogBuffer.LogBuffer(self._log_lines)
+    @property
+    def title(self):
+        return self._title
+    @property
+    def log(self):
+        return self._log
+    @property
+    def job(self):
+        return self._job
+    @property
+    def status(self):
+        if self._job is None:
+            return 'cancelled' if self._cancelled else 'queued'
+        if not self._job.done:
+            return 'running'
+        if self._job.exception is None:
+            return 'done'
+        if isinstance(self._job.exception, _Job.Cancelled):
+            return 'cancelled'
+        return 'failed'
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+    def start(self):
+        self._job = _Job.Job(self._func, *self._args, stderr=self._log).start()
+    def cancel(self):
+        if self._job is None:
+            self._cancelled = True
+        else:
+            self._job.cancel()
+
+
+class JobQueue(_tk.Frame):
+    """Runs the submitted jobs, at most workers at a time,
+    lists their status, duration and last line of stderr,
+    shows the stderr of the selected job as it comes
+    and reports every job that fails in a dialog. """
+    workers = 2 # default number of jobs run at once
+    poll_interval = 200 # milliseconds
+    log_lines = 10_000 # lines of stderr kept (and shown) per job
+    dialog_lines = 20 # lines of stderr shown when a job fails
+    report_failures = True # a dialog for every job that fails
+    _columns = ('status', 'duration', 'stderr')
+    def __init__(self, master, *, workers=None):
+        super().__init__(master)
+        self._entries = dict() # row id -> entry
+        self._pending = _col.deque() # row ids waiting for a worker
+        self._watched = set() # row ids of started jobs that no poll has seen finished
+        self._counter = _it.count(1)
+        self._polling = None
+        self._logShown = (None, None, 0, False) # row, log, position and whether the job had ended
+        self._workers = _tk.IntVar(self, value=self.workers if workers is None else workers)
+        self.buttonFrame = self._add_buttonFrame()
+        self.workersSpinbox = self._add_workersSpinbox()
+        self.cancelButton = self._add_cancelButton()
+        self.retryButton = self._add_retryButton()
+        self.clearButton = self._add_clearButton()
+        self.tree = self._add_tree()
+        self.logText = self._add_logText()
+    @property
+    def rows(self):
+        """The ids of all rows, finished or not. """
+        return tuple(self._entries.keys())
+    @property
+    def busy(self):
+        return any(not x.finished for x in self._entries.values())
+    @property
+    def running(self):
+        return sum(x.status == 'running' for x in self._entries.values())
+    def submit(self, func, /, *args, title=None):
+        """Queue func(*args); returns the id of its row. 
+
+        The row is named by a running number and the optional title. """
+        number = next(self._counter)
+        title = f"#{number}" if (title is None) else f"#{number} {title}"
+        entry = _Entry(func, args, title=title, log_lines=self.log_lines)
+        row = self.tree.insert('', 'end', text=title, values=self._values(entry))
+        self._entries[row] = entry
+        self._pending.append(row)
+        self._schedule()
+        return row
+    def cancel(self, rows=None):
+        for row in self._rows(rows):
+            entry = self._entries[row]
+            if entry.finished:
+                continue
+            if row in self._pending:
+                self._pending.remove(row)
+            entry.cancel()
+            self._refresh(row)
+        self._schedule()
+    def retry(self, rows=None):
+        """Queue the finished jobs among rows once more. """
+        for row in self._rows(rows):
+            entry = self._entries[row]
+            if not entry.finished:
+                continue
+            entry.reset()
+            self._pending.append(row)
+            self._refresh(row)
+        self._schedule()
+    def clear(self):
+        """Remove the rows of all finished jobs. """
+        for row, entry in list(self._entries.items()):
+            if entry.finished:
+                del self._entries[row]
+                self._watched.discard(row)
+                self.tree.delete(row)
+        self._show_log()
+    def destroy(self):
+        if self._polling is not None:
+            self.after_cancel(self._polling)
+            self._polling = None
+        self._pending.clear()
+        for entry in self._entries.values():
+            if not entry.finished:
+                entry.cancel()
+        super().destroy()
+    def _rows(self, rows):
+        if rows is None:
+            rows = self.tree.selection()
+        return [x for x in rows if x in self._entries.keys()]
+    def _schedule(self):
+        self._start_pending()
+        # a job may finish before the first poll, which still has to show it
+        if (self._polling is None) and len(self._watched):
+            self._polling = self.after(self.poll_interval, self._poll)
+    def _poll(self):
+        self._polling = None
+        self._start_pending()
+        failed = list()
+        for row in list(self._watched):
+            entry = self._entries[row]
+            # read before the refresh, so that the row shows at least this status
+            finished = entry.finished
+            self._refresh(row)
+            if not finished:
+                continue
+            self._watched.remove(row)
+            if entry.status == 'failed':
+                failed.append(entry)
+        self._show_log()
+        # the rows and the log are updated before the dialogs wait for the user
+        if self.report_failures:
+            for entry in failed:
+                self._report(entry)
+        self._schedule()
+    def _report(self, entry):
+        exc = entry.job.exception
+        text = '\n'.join(entry.log.tail(self.dialog_lines)).strip('\n')
+        _msg.showerror(
+            title=f"{entry.title} failed",
+            message=f"{type(exc).__name__}: {exc}",
+            detail=text,
+        )
+    def _start_pending(self):
+        # the spinbox may hold anything while it is edited
+        try:
+            workers = max(1, int(self._workers.get()))
+        except (_tk.TclError, ValueError):
+            workers = self.workers
+        free = workers - self.running
+        while free > 0 and len(self._pending):
+            row = self._pending.popleft()
+            self._entries[row].start()
+            self._watched.add(row)
+            self._refresh(row)
+            free -= 1
+    def _refresh(self, row):
+        self.tree.item(row, values=self._values(self._entries[row]))
+    @staticmethod
+    def _values(entry):
+        duration = ""
+        if entry.job is not None:
+            duration = f"{entry.job.duration:.1f} s"
+        tail = entry.log.tail(1)
+        last = tail[0] if len(tail) else ""
+        return (entry.status, duration, last)
+    def _show_log(self, event=None):
+        # appends what the selected job wrote since the last call
+        rows = self._rows(None)
+        row = rows[-1] if len(rows) else None
+        entry = self._entries[row] if (row is not None) else None
+        log = entry.log if (entry is not None) else None
+        shownRow, shownLog, position, ended = self._logShown
+        self.logText.config(state='normal')
+        if (row != shownRow) or (log is not shownLog):
+            # another job, or the same job retried
+            self.logText.delete('1.0', 'end')
+            position = 0
+            ended = False
+        if (log is not None) and not ended:
+            following = self.logText.yview()[1] >= 1.0
+            # a job that has finished before the read writes nothing after it
+            finished = entry.finished
+            lines, position = log.read(position)
+            if finished:
+                # the last line may lack its newline
+                partial = log.getvalue().rpartition('\n')[2]
+                if len(partial):
+                    lines.append(partial)
+            if finished and (entry.status == 'failed'):
+                exc = entry.job.exception
+                lines.append(f"{type(exc).__name__}: {exc}")
+            ended = finished
+            self.logText.insert('end', ''.join(x + '\n' for x in lines))
+            # the widget holds no more lines than the buffer
+            surplus = int(self.logText.index('end-1c').split('.')[0]) - 1 - log.maxlen
+            if surplus > 0:
+                self.logText.delete('1.0', f'{surplus + 1}.0')
+            if following:
+                self.logText.see('end')
+        self.logText.config(state='disabled')
+        self._logShown = (row, log, position, ended)
+    def _add_buttonFrame(self):
+        ans = _tk.Frame(self)
+        ans.pack(
+            side='bottom',
+            fill='x',
+            padx=0,
+            pady=0,
+        )
+        return ans
+    def _add_workersSpinbox(self):
+        _ttk.Label(self.buttonFrame, text="workers").pack(
+            side='left',
+            padx=10,
+            pady=10,
+        )
+        ans = _ttk.Spinbox(
+            self.buttonFrame,
+            from_=1,
+            to=64,
+            width=4,
+            textvariable=self._workers,
+            command=self._schedule,
+        )
+        ans.pack(
+            side='left',
+            pady=10,
+        )
+        return ans
+    def _add_cancelButton(self):
+        ans = _ttk.Button(
+            self.buttonFrame,
+            text="cancel",
+            command=self.cancel,
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_retryButton(self):
+        ans = _ttk.Button(
+            self.buttonFrame,
+            text="retry",
+            command=self.retry,
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_clearButton(self):
+        ans = _ttk.Button(
+            self.buttonFrame,
+            text="clear",
+            command=self.clear,
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_tree(self):
+        ans = _ttk.Treeview(
+            self,
+            columns=self._columns,
+            height=6,
+            selectmode='extended',
+        )
+        ans.heading('#0', text="job")
+        ans.column('#0', width=80, stretch=False)
+        ans.heading('status', text="status")
+        ans.column('status', width=80, stretch=False)
+        ans.heading('duration', text="duration")
+        ans.column('duration', width=80, stretch=False)
+        ans.heading('stderr', text="stderr")
+        ans.column('stderr', width=300)
+        ans.bind('<<TreeviewSelect>>', self._show_log)
+        ans.pack(
+            side='top',
+            fill='both',
+            expand=True,
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_logText(self):
+        ans = _st.ScrolledText(self, height=10, state='disabled')
+        ans.pack(
+            side='top',
+            fill='both',
+            expand=True,
+            padx=10,
+            pady=0,
+        )
+        return ans
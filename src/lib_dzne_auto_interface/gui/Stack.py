@@ -3,6 +3,14 @@ import tkinter.ttk as _ttk
 
 
 class Stack(_tk.Frame):
+    @classmethod
+    def make(cls, master, *, factories, models):
+        """A Stack, or for many levels a VirtualStack; 
+        models[i] describes the level factories[i] creates. """
+        factories = list(factories)
+        if len(factories) > VirtualStack.threshold:
+            return VirtualStack(master, factories=factories, models=models)
+        return cls(master, factories=factories)
     @property
     def levels(self):
         return tuple(self._levels)
@@ -20,3 +28,190 @@ class Stack(_tk.Frame):
                 padx=(0, 0),
                 pady=(padN, padS),
             )
+
+
+class VirtualStack(_tk.Frame):
+    """A scrollable Stack that only holds widgets for the levels in view. 
+
+    The state of every other level is kept in a plain list 
+    and handed to a new widget once the level scrolls back into view. 
+    Its levels are proxies that offer parse, get_args, state and active 
+    for every level, whether it is in view or not; 
+    they are computed from the state by the model of the level, 
+    which has the initial state of the level as its state 
+    and the methods parse_of and/or args_of of its widget. """
+    threshold = 30 # Stack.make uses VirtualStack for more levels than this
+    height = 400
+    padding = 10
+    _wheel_sequences = ('<MouseWheel>', '<Button-4>', '<Button-5>')
+    @property
+    def levels(self):
+        return tuple(_Level(self, i) for i in range(len(self._factories)))
+    def __init__(self, master, *, factories, models):
+        super().__init__(master)
+        self._factories = list(factories)
+        self._models = list(models)
+        self._states = [None] * len(self._factories) # None means untouched
+        self._widgets = dict() # index -> (widget, canvas item)
+        self._rowHeight = 1
+        self._scrollbar = _ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self._scrollbar.pack(side='right', fill='y')
+        self._canvas = _tk.Canvas(
+            self, 
+            height=self.height, 
+            highlightthickness=0,
+            yscrollcommand=self._scrollbar.set,
+        )
+        self._canvas.pack(side='left', fill='both', expand=True)
+        self._canvas.bind('<Configure>', self._configure)
+        # the wheel scrolls the stack under the pointer; 
+        # a bindtag of its own goes to the canvas and to every level in view
+        self._wheelTag = f"wheel{id(self)}"
+        for sequence in self._wheel_sequences:
+            self.bind_class(self._wheelTag, sequence, self._wheel)
+        self._add_wheel_tag(self._canvas)
+        self._measure()
+    def destroy(self):
+        for sequence in self._wheel_sequences:
+            self.unbind_class(self._wheelTag, sequence)
+        super().destroy()
+    def _measure(self):
+        if not len(self._factories):
+            return
+        # never placed on the canvas
+        widget = self._factories[0](self._canvas)
+        widget.update_idletasks()
+        self._rowHeight = widget.winfo_reqheight() + self.padding
+        widget.destroy()
+        self._update_scrollregion()
+    def _state(self, index):
+        if index in self._widgets.keys():
+            return self._widgets[index][0].state
+        if self._states[index] is None:
+            return self._models[index].state
+        return self._states[index]
+    def _create(self, index):
+        widget = self._factories[index](self._canvas)
+        if self._states[index] is not None:
+            widget.state = self._states[index]
+        # nested stacks come first, so their levels scroll them only
+        self._add_wheel_tag(widget)
+        self._inherit_tags(widget)
+        return widget
+    def _add_wheel_tag(self, widget):
+        widgets = [widget]
+        while len(widgets):
+            widget = widgets.pop()
+            tags = widget.bindtags()
+            if self._wheelTag not in tags:
+                widget.bindtags(tags + (self._wheelTag,))
+            widgets += widget.winfo_children()
+    def _inherit_tags(self, widget):
+        # bindtags that were added to the stack (e.g. for validation) 
+        # apply to the levels that scroll into view later as well
+        own = {str(self), self.winfo_class(), str(self.winfo_toplevel()), 'all'}
+        extra = tuple(x for x in self.bindtags() if x not in own)
+        if not len(extra):
+            return
+        widgets = [widget]
+        while len(widgets):
+            widget = widgets.pop()
+            tags = widget.bindtags()
+            widget.bindtags(tags + tuple(x for x in extra if x not in tags))
+            widgets += widget.winfo_children()
+    def _save(self, index, widget):
+        self._states[index] = widget.state
+    def _update_scrollregion(self):
+        width = self._canvas.winfo_width()
+        self._canvas.config(scrollregion=(0, 0, width, self._rowHeight * len(self._factories)))
+    def _visible(self):
+        top = self._canvas.canvasy(0)
+        bottom = top + max(self._canvas.winfo_height(), self.height)
+        first = max(0, int(top // self._rowHeight) - 1)
+        last = min(len(self._factories), int(bottom // self._rowHeight) + 2)
+        return range(first, last)
+    def _refresh(self):
+        visible = self._visible()
+        for index in list(self._widgets.keys()):
+            if index not in visible:
+                widget, item = self._widgets.pop(index)
+                self._save(index, widget)
+                self._canvas.delete(item)
+                widget.destroy()
+        for index in visible:
+            if index in self._widgets.keys():
+                continue
+            widget = self._create(index)
+            item = self._canvas.create_window(
+                0, 
+                index * self._rowHeight, 
+                anchor='nw', 
+                window=widget, 
+                width=self._canvas.winfo_width(),
+            )
+            self._widgets[index] = (widget, item)
+            self._grow(widget)
+    def _grow(self, widget):
+        # levels are laid out in slots of the tallest level seen so far
+        widget.update_idletasks()
+        height = widget.winfo_reqheight() + self.padding
+        if height <= self._rowHeight:
+            return
+        self._rowHeight = height
+        for index, (widget, item) in self._widgets.items():
+            self._canvas.coords(item, 0, index * self._rowHeight)
+        self._update_scrollregion()
+    def _configure(self, event):
+        for widget, item in self._widgets.values():
+            self._canvas.itemconfigure(item, width=event.width)
+        self._update_scrollregion()
+        self._refresh()
+    def yview(self, *args):
+        """Scroll like Canvas.yview, e.g. yview('moveto', 1.0); 
+        without arguments return the visible fraction of the levels. """
+        ans = self._canvas.yview(*args)
+        self._refresh()
+        return ans
+    def _wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if (event.delta > 0) else 1
+        self.yview('scroll', delta, 'units')
+        return 'break' # keeps enclosing stacks from scrolling as well
+
+
+class _Level(object):
+    def __init__(self, stack, index):
+        self._stack = stack
+        self._index = index
+    def parse(self, placeholders=None):
+        return self.parse_of(self.state, placeholders)
+    def parse_of(self, state, placeholders=None):
+        return self._stack._models[self._index].parse_of(state, placeholders)
+    def get_args(self):
+        return self.args_of(self.state)
+    def args_of(self, state):
+        return self._stack._models[self._index].args_of(state)
+    @property
+    def state(self):
+        return self._stack._state(self._index)
+    @state.setter
+    def state(self, value):
+        if self._index in self._stack._widgets.keys():
+            self._stack._widgets[self._index][0].state = value
+        else:
+            self._stack._states[self._index] = value
+    @property
+    def active(self):
+        # the state of an input starts with its active flag
+        return self.state[0]
+    @active.setter
+    def active(self, value):
+        if self._index in self._stack._widgets.keys():
+            self._stack._widgets[self._index][0].active = value
+        else:
+            active, state = self.state
+            self._stack._states[self._index] = (bool(value), state)
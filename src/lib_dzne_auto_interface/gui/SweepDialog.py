@@ -0,0 +1,71 @@
+import shlex as _shlex
+import tkinter as _tk
+import tkinter.filedialog as _filedialog
+import tkinter.messagebox as _msgbox
+import tkinter.ttk as _ttk
+
+
+class SweepDialog(_tk.Toplevel):
+    """Asks for the values of a sweep.
+
+    Each line holds a placeholder and its values, e.g. 't 0.1 0.2';
+    the fields of the form refer to it as {t}.
+    On ok, command is called as command(values, mode=..., summary=...). """
+    def __init__(self, master, *, command):
+        super().__init__(master)
+        self.title("sweep")
+        self._command = command
+        self._zip = _tk.BooleanVar(self, value=False)
+        self._summary = _tk.StringVar(self, value="")
+        _ttk.Label(
+            self,
+            text="One placeholder per line: NAME VALUE VALUE ...\nUse {NAME} (and {index}) in the fields.",
+        ).pack(side='top', anchor='w', padx=10, pady=10)
+        self.valuesText = _tk.Text(self, height=6, width=50)
+        self.valuesText.pack(side='top', fill='both', expand=True, padx=10)
+        _ttk.Checkbutton(
+            self,
+            text="zip the values instead of combining all of them",
+            variable=self._zip,
+        ).pack(side='top', anchor='w', padx=10, pady=10)
+        summaryFrame = _tk.Frame(self)
+        summaryFrame.pack(side='top', fill='x', padx=10)
+        _ttk.Label(summaryFrame, text="summary").pack(side='left')
+        _ttk.Entry(summaryFrame, textvariable=self._summary).pack(side='left', fill='x', expand=True, padx=10)
+        _ttk.Button(summaryFrame, text="...", command=self._browse).pack(side='left')
+        buttonFrame = _tk.Frame(self)
+        buttonFrame.pack(side='bottom', fill='x')
+        _ttk.Button(buttonFrame, text="ok", command=self.ok).pack(side='right', padx=10, pady=10)
+        _ttk.Button(buttonFrame, text="cancel", command=self.destroy).pack(side='right', padx=10, pady=10)
+    @property
+    def values(self):
+        ans = dict()
+        for line in self.valuesText.get('1.0', 'end').splitlines():
+            words = _shlex.split(line)
+            if not len(words):
+                continue
+            name, *values = words
+            if not len(values):
+                raise ValueError(f"The placeholder {name!r} has no values. ")
+            ans[name] = values
+        if not len(ans):
+            raise ValueError("No placeholders were given. ")
+        return ans
+    def ok(self):
+        try:
+            values = self.values
+        except ValueError as exc:
+            _msgbox.showerror(title=type(exc).__name__, message=str(exc), parent=self)
+            return
+        mode = 'zip' if self._zip.get() else 'product'
+        summary = self._summary.get() or None
+        self.destroy()
+        self._command(values, mode=mode, summary=summary)
+    def _browse(self):
+        file = _filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension='.json',
+            filetypes=[("JSON", '*.json')],
+        )
+        if file:
+            self._summary.set(file)
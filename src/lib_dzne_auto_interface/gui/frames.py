@@ -0,0 +1,483 @@
+import io as _io
+import tkinter as _tk
+import tkinter.messagebox as _msg
+import tkinter.ttk as _ttk
+
+import lib_dzne_auto_interface.gui.HelpButton as _HB
+import lib_dzne_auto_interface.gui.inputs as _inputs
+import lib_dzne_auto_interface.gui.JobQueue as _JobQueue
+import lib_dzne_auto_interface.gui.Stack as _Stack
+import lib_dzne_auto_interface.gui.SweepDialog as _SweepDialog
+import lib_dzne_auto_interface.Job as _Job
+import lib_dzne_auto_interface.LogBuffer as _LogBuffer
+import lib_dzne_auto_interface.Sweep as _Sweep
+
+
+class KnotFrame(_tk.Frame):
+    @property
+    def knot(self):
+        return self._knot
+    def __init__(self, master, *, knot, **kwargs):
+        super().__init__(master)
+        self._knot = knot
+        self._init(**kwargs)
+    @property
+    def busy(self):
+        return False
+    @property
+    def retained(self):
+        """Whether the frame holds jobs (running or finished) that its state does not. """
+        return False
+    @property
+    def state(self):
+        raise NotImplementedError
+    def parse(self, placeholders=None):
+        return self.parse_of(self.state, placeholders)
+    def parse_of(self, state, placeholders=None):
+        """What parse would return with the frame in state. """
+        raise NotImplementedError
+
+
+class _StackFrame(KnotFrame):
+    @property
+    def state(self):
+        return [level.state for level in self.stack.levels]
+    @state.setter
+    def state(self, value):
+        for level, state in zip(self.stack.levels, value):
+            level.state = state
+
+
+class ArgumentFrame(KnotFrame):
+    validation_delay = 300 # milliseconds after the last change
+    validation_cache = 32 # field values whose outcome is remembered
+    _validation_events = ('<KeyRelease>', '<ButtonRelease-1>', '<<ComboboxSelected>>')
+    @property
+    def changed_argument(self):
+        return self._model.argument
+    @property
+    def state(self):
+        return self._argumentInput.state
+    @state.setter
+    def state(self, value):
+        self._argumentInput.state = value
+        self._schedule_validation()
+    def _init(self):
+        self._model = _ArgumentModel(self.knot)
+        self._labelFrame = self._add_labelFrame()
+        self._helpButton = self._add_helpButton()
+        self._argumentInput = self._add_argumentInput()
+        self._errorLabel = _ttk.Label(self, foreground='red')
+        self._validations = dict() # ordered from least to most recently used
+        self._validation = None
+        # a bindtag of its own lets every widget of the input report changes
+        self._tag = f"validation{id(self)}"
+        for event in self._validation_events:
+            self.bind_class(self._tag, event, self._schedule_validation)
+        self._add_tag(self._argumentInput)
+    def destroy(self):
+        if self._validation is not None:
+            self.after_cancel(self._validation)
+        for event in self._validation_events:
+            self.unbind_class(self._tag, event)
+        super().destroy()
+    def validate(self):
+        """Check the field as it is and show the error next to it. 
+
+        Returns the error message or None. 
+        The outcome is remembered for the last few values of the field. """
+        self._validation = None
+        self._add_tag(self._argumentInput) # widgets created since
+        try:
+            args = tuple(self._argumentInput.get_args())
+        except ValueError as exc:
+            message = str(exc)
+        else:
+            if args in self._validations.keys():
+                message = self._validations.pop(args)
+            else:
+                message = self._check(args)
+            self._validations[args] = message
+            while len(self._validations) > self.validation_cache:
+                del self._validations[next(iter(self._validations))]
+        if message is None:
+            self._errorLabel.pack_forget()
+        else:
+            self._errorLabel.config(text=message)
+            self._errorLabel.pack(side='bottom', anchor='w', padx=10)
+        return message
+    def _check(self, args):
+        log = _io.StringIO()
+        try:
+            # argparse reports errors on stderr before it exits
+            with _Job.redirect_stderr(log):
+                self.knot.parse(list(args))
+        except SystemExit:
+            lines = log.getvalue().strip().splitlines()
+            if not len(lines):
+                return "invalid value"
+            return lines[-1].partition(": error: ")[2] or lines[-1]
+        except Exception as exc:
+            return str(exc)
+        return None
+    def _schedule_validation(self, event=None):
+        if self._validation is not None:
+            self.after_cancel(self._validation)
+        self._validation = self.after(self.validation_delay, self.validate)
+    def _add_tag(self, widget):
+        tags = widget.bindtags()
+        if self._tag not in tags:
+            widget.bindtags(tags + (self._tag,))
+        for child in widget.winfo_children():
+            self._add_tag(child)
+    def parse_of(self, state, placeholders=None):
+        return self._model.parse_of(state, placeholders)
+    def _add_labelFrame(self):
+        ans = _tk.LabelFrame(
+            self, 
+            text=self.knot.dest,
+        )
+        ans.pack(fill='both', expand=True)
+        return ans
+    def _add_helpButton(self):
+        if self.knot.help is None:
+            return None
+        ans = _HB.HelpButton(
+            self._labelFrame,
+            title=f"help: {self.knot.dest}",
+            message=self.knot.help,
+        )
+        ans.pack(
+            side='right',
+            #fill='y',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_argumentInput(self):
+        ans = _inputs.ArgumentInput(
+            self._labelFrame, 
+            argument=self.changed_argument,
+        )
+        ans.pack(
+            padx=10,
+            pady=10,
+            side='left',
+            fill='both',
+            expand=True,
+        )
+        return ans
+
+
+class ParameterFrame(_StackFrame):
+    def _init(self):
+        self._model = _ParameterModel(self.knot)
+        self.stack = self._add_stack()
+    def parse_of(self, state, placeholders=None):
+        return self._model.parse_of(state, placeholders)
+    def _add_stack(self):
+        ans = _Stack.Stack.make(
+            self, 
+            factories=[x.frame for x in self.knot.subknots], 
+            models=self._model.models,
+        )
+        ans.pack(
+            expand=True,
+            fill='both',
+        )
+        return ans
+
+
+class CallableFrame(_StackFrame):
+    dialog_lines = 20 # lines of stderr shown when the form cannot be read
+    def _init(self):
+        self.buttonFrame = self._add_buttonFrame()
+        self.helpButton = self._add_helpButton()
+        self.goButton = self._add_goButton()
+        self.sweepButton = self._add_sweepButton()
+        self.queue = self._add_queue()
+        self.stack = self._add_stack()
+    def parse(self, placeholders=None):
+        ans = dict()
+        for level in self.stack.levels:
+            kwargs = level.parse(placeholders)
+            ans = dict(**ans, **kwargs)
+        return ans
+    @property
+    def busy(self):
+        return self.queue.busy
+    @property
+    def retained(self):
+        return len(self.queue.rows) > 0
+    def go(self):
+        """Queue a run of the form as it is now. """
+        dictionary = self._read(self.parse)
+        if dictionary is not None:
+            self.queue.submit(self.knot.run_dictionary, dictionary)
+    def sweep(self, values, *, mode='product', summary=None):
+        """Queue a job that runs the form once per combination of values 
+        with the placeholders in its fields replaced. """
+        def prepare():
+            combinations = _Sweep.combinations(values, mode=mode)
+            jobs = [self.parse(x) for x in _Sweep.placeholders(combinations)]
+            return combinations, jobs
+        def run(combinations, jobs):
+            # forking next to a running Tk is not safe, hence threads
+            outcomes = _Sweep.run_jobs(
+                self.knot, 
+                combinations, 
+                jobs, 
+                mode=mode, 
+                summary=summary, 
+                executor='thread',
+            )
+            failed = _Sweep.report_failures(outcomes)
+            if len(failed):
+                raise RuntimeError(f"{len(failed)} of {len(outcomes)} combinations failed. ")
+        prepared = self._read(prepare)
+        if prepared is not None:
+            self.queue.submit(run, *prepared, title="sweep")
+    def _read(self, func):
+        # the form must be read on the main thread; 
+        # returns None if it cannot be read
+        log = _LogBuffer.LogBuffer(self.dialog_lines)
+        try:
+            with _Job.redirect_stderr(log):
+                return func()
+        except BaseException as exc:
+            self._report(exc, log)
+            return None
+    def _report(self, exc, log):
+        if exc is not None:
+            _msg.showerror(
+                title=type(exc).__name__,
+                message=str(exc),
+            )
+        text = '\n'.join(log.tail(self.dialog_lines))
+        text = text.strip('\n')
+        if len(text):
+            _msg.showwarning(
+                title="Error Log",
+                message=text,
+            )
+    def _add_buttonFrame(self):
+        ans = _tk.Frame(self)
+        ans.pack(
+            side='bottom',
+            fill='x',
+            padx=0,
+            pady=0,
+        )
+        return ans
+    def _add_queue(self):
+        labelFrame = _tk.LabelFrame(self, text="jobs")
+        labelFrame.pack(
+            side='bottom',
+            fill='both',
+            expand=True,
+            padx=10,
+            pady=0,
+        )
+        ans = _JobQueue.JobQueue(labelFrame)
+        ans.pack(
+            fill='both',
+            expand=True,
+        )
+        return ans
+    def _add_helpButton(self):
+        ans = _HB.HelpButton.make(
+            self.buttonFrame,
+            title="help",
+            message=self.knot.description,
+        )
+        if ans is None:
+            return ans
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_goButton(self):
+        ans = _ttk.Button(
+            self.buttonFrame,
+            text="go",
+            command=self.go,
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_sweepButton(self):
+        ans = _ttk.Button(
+            self.buttonFrame,
+            text="sweep",
+            command=lambda: _SweepDialog.SweepDialog(self, command=self.sweep),
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_stack(self):
+        ans = _Stack.Stack.make(
+            self, 
+            factories=[x.frame for x in self.knot.subknots], 
+            models=[_model(x) for x in self.knot.subknots],
+        )
+        ans.pack(
+            side='top',
+            fill='x',
+            padx=10,
+            pady=10,
+        )
+        return ans
+
+
+class UncallableFrame(KnotFrame):
+    max_tabs = 8 # materialized tabs kept at once, besides those with jobs; None keeps all
+    @property
+    def busy(self):
+        return any(x.busy for x in self._subframes.values())
+    @property
+    def retained(self):
+        return any(x.retained for x in self._subframes.values())
+    @property
+    def state(self):
+        ans = dict(self._states)
+        for name, subframe in self._subframes.items():
+            ans[name] = subframe.state
+        return ans
+    @state.setter
+    def state(self, value):
+        for name, state in value.items():
+            if name in self._subframes.keys():
+                self._subframes[name].state = state
+            else:
+                self._states[name] = state
+    def _init(self):
+        self.buttonFrame = self._add_buttonFrame()
+        self.helpButton = self._add_helpButton()
+        self.notebook = self._add_notebook()#ttk.Notebook(container,**options)
+        # every tab starts as an empty placeholder 
+        # that receives its form when it is first selected
+        self._names = self.knot.names
+        self._placeholders = dict()
+        self._subframes = dict() # ordered from least to most recently used
+        self._states = dict() # states of forms that were destroyed
+        for name in self._names:
+            placeholder = _tk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=name)
+            self._placeholders[name] = placeholder
+        self.notebook.bind('<<NotebookTabChanged>>', self._tab_changed)
+        if len(self._names):
+            self.materialize(self._names[0])
+    def materialize(self, name):
+        if name in self._subframes.keys():
+            self._subframes[name] = self._subframes.pop(name)
+            return self._subframes[name]
+        subframe = self.knot.main(name).frame(self._placeholders[name])
+        subframe.pack(
+            expand=True,
+            fill='both',
+        )
+        if name in self._states.keys():
+            subframe.state = self._states.pop(name)
+        self._subframes[name] = subframe
+        self._evict()
+        return subframe
+    def _tab_changed(self, event):
+        index = self.notebook.index(self.notebook.select())
+        self.materialize(self._names[index])
+    def _evict(self):
+        if self.max_tabs is None:
+            return
+        surplus = len(self._subframes) - self.max_tabs
+        for name in list(self._subframes.keys())[:-1]:
+            if surplus <= 0:
+                return
+            subframe = self._subframes[name]
+            # destroying a tab would take its queue, finished jobs included, with it
+            if subframe.retained:
+                continue
+            self._states[name] = subframe.state
+            del self._subframes[name]
+            subframe.destroy()
+            surplus -= 1
+    def _add_notebook(self):
+        ans = _ttk.Notebook(self)
+        ans.pack(
+            side='top',
+            fill='both',
+            expand=True,
+            padx=10,
+            pady=10,
+        )
+        return ans
+    def _add_buttonFrame(self):
+        ans = _tk.Frame(self)
+        ans.pack(
+            side='bottom',
+            fill='x',
+            padx=0,
+            pady=0,
+        )
+        return ans
+    def _add_helpButton(self):
+        if self.knot.description is None:
+            return None
+        ans = _HB.HelpButton(
+            self.buttonFrame,
+            title="help",
+            message=self.knot.description,
+        )
+        ans.pack(
+            side='right',
+            padx=10,
+            pady=10,
+        )
+
+
+class _ArgumentModel(object):
+    # what an ArgumentFrame reads, without the widgets; see Stack.VirtualStack
+    def __init__(self, knot):
+        self._knot = knot
+        self._argument = knot.change(help=None)
+        self._input = _inputs.Model(_inputs.ArgumentInput, argument=self._argument)
+    @property
+    def argument(self):
+        return self._argument
+    @property
+    def state(self):
+        return self._input.state
+    def parse_of(self, state, placeholders=None):
+        args = self._input.args_of(state)
+        if placeholders is not None:
+            args = [_Sweep.substitute(x, placeholders) for x in args]
+        kwargs = self._knot.parse(args)
+        return kwargs
+
+class _ParameterModel(object):
+    # what a ParameterFrame reads, without the widgets
+    def __init__(self, knot):
+        self._models = [_ArgumentModel(x) for x in knot.subknots]
+    @property
+    def models(self):
+        return list(self._models)
+    @property
+    def state(self):
+        return [x.state for x in self._models]
+    def parse_of(self, state, placeholders=None):
+        ans = dict()
+        for model, substate in zip(self._models, state):
+            kwargs = model.parse_of(substate, placeholders)
+            ans = dict(**ans, **kwargs)
+        return ans
+
+def _model(knot):
+    if knot._frame_name == 'ParameterFrame':
+        return _ParameterModel(knot)
+    return _ArgumentModel(knot)
@@ -11,35 +11,59 @@ import lib_dzne_auto_interface.gui.Stack as _Stack
 
 def get(master, *, argument):
     """Create an input widget. """
+    ans = model(argument)
+    if ans is None:
+        return None
+    return ans.create(master)
+
+def model(argument):
+    """The model of the input widget get creates, or None. """
     dim = int(argument.nargs is not None)
     func = [
-        _get_dim_0,
-        _get_dim_1,
+        _model_dim_0,
+        _model_dim_1,
     ][dim]
-    return func(master, argument=argument)
+    return func(argument)
 
 
-def _get_dim_0(master, *, argument):
+def _model_dim_0(argument):
     if argument.action == 'store_true':
-        return None # FlagInput(master)
+        return None # Model(FlagInput)
     if argument.action == 'store_false':
-        return None # FlagInput(master)
+        return None # Model(FlagInput)
     if argument.choices is not None:
-        return ChoicesInput(master, choices=argument.choices)
+        return Model(ChoicesInput, choices=argument.choices)
     if _fd.is_File(argument.type):
-        return FileInput(master, ext=argument.type(None).ext, of_return=argument.of_return)
-    return TextInput(master)
+        return Model(FileInput, ext=argument.type(None).ext, of_return=argument.of_return)
+    return Model(TextInput)
 
-def _get_dim_1(master, *, argument):
+def _model_dim_1(argument):
     if type(argument.nargs) is int:
-        return NargsIntInput(master, argument=argument)
+        return Model(NargsIntInput, argument=argument)
     if argument.nargs == '?':
-        return QuestionInput(master, argument=argument)
+        return Model(QuestionInput, argument=argument)
     if argument.nargs in ('*', '+'):
-        return NargsPluralInput(master)
+        return Model(NargsPluralInput)
     raise NotImplementedError
 
 
+class Model(object):
+    """An input of class cls made with kwargs, without the widget. 
+
+    It knows the state of a new input and the args of every state, 
+    so the levels of a VirtualStack that are out of view need no widgets. """
+    def __init__(self, cls, /, **kwargs):
+        self._cls = cls
+        self._kwargs = kwargs
+    @property
+    def state(self):
+        return (True, self._cls._initial(**self._kwargs))
+    def args_of(self, state):
+        return self._cls._args(state, **self._kwargs)
+    def create(self, master):
+        return self._cls(master, **self._kwargs)
+
+
 
 
 
@@ -47,6 +71,7 @@ def _get_dim_1(master, *, argument):
 class _Input(_tk.Frame):
     def __init__(self, master, *, active=True, **kwargs):
         super().__init__(master)
+        self._kwargs = kwargs
         self._init(**kwargs)
         self.active = active
     @property
@@ -57,12 +82,28 @@ class _Input(_tk.Frame):
         value = bool(value)
         self._config_active(value)
         self._active = value
+    @property
+    def state(self):
+        return (self.active, self._get_state())
+    @state.setter
+    def state(self, value):
+        active, state = value
+        self._config_active(True) # disabled widgets ignore changes
+        self._set_state(state)
+        self.active = active
     def get_args(self):
-        raise NotImplementedError
+        return self.args_of(self.state)
+    def args_of(self, state):
+        """The args of an input of this configuration in state. """
+        return self._args(state, **self._kwargs)
     # for all non-abstract subclasses the following functions must be defined:
     #     _init
     #     _config_active
-    #     get_args
+    #     _get_state
+    #     _set_state
+    # and the following classmethods, which take the keyword arguments of _init:
+    #     _initial (the result of _get_state for a new input)
+    #     _args (the args in a state)
 
 
 class FlagInput(_Input):
@@ -70,7 +111,15 @@ class FlagInput(_Input):
         pass
     def _config_active(self, value):
         pass
-    def get_args(self):
+    def _get_state(self):
+        return None
+    def _set_state(self, value):
+        pass
+    @classmethod
+    def _initial(cls):
+        return None
+    @classmethod
+    def _args(cls, state):
         return []
 
 
@@ -86,8 +135,17 @@ class ChoicesInput(_Input):
     def _config_active(self, value):
         state = 'readonly' if value else 'disabled'
         self._combobox.config(state=state)
-    def get_args(self):
-        return [self.string]
+    def _get_state(self):
+        return self.string
+    def _set_state(self, value):
+        self._stringVar.set(value)
+    @classmethod
+    def _initial(cls, choices):
+        return ""
+    @classmethod
+    def _args(cls, state, choices):
+        active, string = state
+        return [string]
 
 
 class FileInput(_Input):
@@ -120,8 +178,17 @@ class FileInput(_Input):
         state = 'normal' if value else 'disabled'
         self._entry.config(state=state)
         self._button.config(state=state)
-    def get_args(self):
-        return [self.string]
+    def _get_state(self):
+        return self.string
+    def _set_state(self, value):
+        self._stringVar.set(value)
+    @classmethod
+    def _initial(cls, *, of_return, ext):
+        return ""
+    @classmethod
+    def _args(cls, state, *, of_return, ext):
+        active, string = state
+        return [string]
     def browse(self):
         if self._of_return:
             func = _filedialog.asksaveasfilename
@@ -147,35 +214,73 @@ class TextInput(_Input):
     def _config_active(self, value):
         state = 'normal' if value else 'disabled'
         self._text.config(state=state)
-    def get_args(self):
-        return [self.string]
+    def _get_state(self):
+        return self.string
+    def _set_state(self, value):
+        self._text.delete("1.0", "end")
+        self._text.insert("1.0", value)
+    @classmethod
+    def _initial(cls):
+        return ""
+    @classmethod
+    def _args(cls, state):
+        active, string = state
+        return [string]
 
 
 class CheckableInput(_Input):
     @property
     def checked(self):
         return bool(self._intVar.get())
-    def _init(self, *, factory, required, default=True, option_strings=[]):
-        default = int(bool(default))
+    def _init(self, **kwargs):
+        options = self._options(**kwargs)
         self._intVar = _tk.IntVar()
-        self._intVar.set(default)
-        self._checkbutton = self._add_checkbutton(required)
-        self._subinput = self._add_subinput(factory)
-        self._option_strings = list(option_strings)
+        self._intVar.set(int(options['default']))
+        self._checkbutton = self._add_checkbutton(options['required'])
+        self._subinput = self._add_subinput(options['subargument'])
+    @classmethod
+    def _options(cls, *, subargument, required, default=True, option_strings=[]):
+        # subclasses derive these from keyword arguments of their own
+        return {
+            'subargument': subargument,
+            'required': bool(required),
+            'default': bool(default),
+            'option_strings': list(option_strings),
+        }
     def _config_active(self, value):
         self._subinput.active = value
         if self._checkbutton is not None:
             state = 'normal' if value else 'disabled'
             self._checkbutton.config(state=state)
-    def get_args(self):
+    def _get_state(self):
+        if self._subinput is None:
+            return (self.checked, None)
+        return (self.checked, self._subinput.state)
+    def _set_state(self, value):
+        checked, state = value
+        self._intVar.set(int(bool(checked)))
+        if self._subinput is not None:
+            self._subinput.state = state
+    @classmethod
+    def _initial(cls, **kwargs):
+        options = cls._options(**kwargs)
+        submodel = model(options['subargument'])
+        if submodel is None:
+            return (options['default'], None)
+        return (options['default'], submodel.state)
+    @classmethod
+    def _args(cls, state, **kwargs):
+        options = cls._options(**kwargs)
+        active, (checked, substate) = state
         ans = list()
-        if not self.checked:
+        if not checked:
             return ans
-        if len(self._option_strings):
-            ans.append(self._option_strings[0])
-        if self._subinput is None:
+        if len(options['option_strings']):
+            ans.append(options['option_strings'][0])
+        submodel = model(options['subargument'])
+        if submodel is None:
             return ans
-        ans += self._subinput.get_args()
+        ans += submodel.args_of(substate)
         return ans
     def _check_change(self):
         if self._subinput is not None:
@@ -194,8 +299,8 @@ class CheckableInput(_Input):
             pady=(0, 0),
         )
         return ans
-    def _add_subinput(self, factory):
-        ans = factory(self)
+    def _add_subinput(self, subargument):
+        ans = get(self, argument=subargument)
         if ans is None:
             return None
         padE = 0 if (self._checkbutton is None) else 10
@@ -210,17 +315,15 @@ class CheckableInput(_Input):
 
 
 class QuestionInput(CheckableInput):
-    def _init(self, argument):
+    @classmethod
+    def _options(cls, *, argument):
         if argument.nargs != '?':
             raise ValueError
-        self._factory_argument = argument.change(nargs=None)
-        super()._init(
-            factory=self._factory, 
+        return super()._options(
+            subargument=argument.change(nargs=None), 
             required=False,
             option_strings=argument.option_strings,
         )
-    def _factory(self, master):
-        return get(master, argument=self._factory_argument)
 
 
 class NargsIntInput(_Input):
@@ -229,19 +332,33 @@ class NargsIntInput(_Input):
             raise TypeError
         if argument.nargs < 0:
             raise ValueError
-        self._argument = argument
-        factories = [self._factory] * argument.nargs
-        self._stack = _Stack.Stack(self, factories=factories)
-    def _factory(self, master):
-        return _get_dim_0(master, argument=self._argument)
-    def get_args(self):
+        # flags have nargs=0 and no model
+        submodel = _model_dim_0(argument)
+        self._stack = _Stack.Stack.make(
+            self, 
+            factories=[submodel.create for i in range(argument.nargs)],
+            models=[submodel for i in range(argument.nargs)],
+        )
+    @classmethod
+    def _initial(cls, argument):
+        submodel = _model_dim_0(argument)
+        return [submodel.state for i in range(argument.nargs)]
+    @classmethod
+    def _args(cls, state, argument):
+        active, states = state
+        submodel = _model_dim_0(argument)
         ans = list()
-        for level in self._stack.levels:
-            ans += level.get_args()
+        for substate in states:
+            ans += submodel.args_of(substate)
         return ans
     def _config_active(self, value):
         for level in self._stack.levels:
             level.active = value
+    def _get_state(self):
+        return [level.state for level in self._stack.levels]
+    def _set_state(self, value):
+        for level, state in zip(self._stack.levels, value):
+            level.state = state
 
 
 class NargsPluralInput(_Input):
@@ -251,22 +368,28 @@ class NargsPluralInput(_Input):
     def _config_active(self, value):
         state = 'normal' if value else 'disabled'
         self._scrolledText.config(state=state)
-    def get_args(self):
-        ans = self._scrolledText.get("1.0", "end-1c")
-        ans = _parsing.parse(ans)
-        return ans
+    def _get_state(self):
+        return self._scrolledText.get("1.0", "end-1c")
+    def _set_state(self, value):
+        self._scrolledText.delete("1.0", "end")
+        self._scrolledText.insert("1.0", value)
+    @classmethod
+    def _initial(cls):
+        return ""
+    @classmethod
+    def _args(cls, state):
+        active, string = state
+        return _parsing.parse(string)
 
 
 class ArgumentInput(CheckableInput):
-    def _init(self, argument):
-        self._factory_argument = argument.change(required=False)
-        super()._init(
-            factory=self._factory, 
+    @classmethod
+    def _options(cls, *, argument):
+        return super()._options(
+            subargument=argument.change(required=False), 
             required=argument.required,
             option_strings=argument.option_strings,
         )
-    def _factory(self, master):
-        return get(master, argument=self._argument)
 
 
 
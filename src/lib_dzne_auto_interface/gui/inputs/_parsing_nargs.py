@@ -1,87 +1,51 @@
+import re as _re
 import string as _str
 
+_WHITESPACE = _re.escape(_str.whitespace)
+_SPACE = _re.compile(f'[{_WHITESPACE}]*')
+_WORD = _re.compile(f'[^{_WHITESPACE}"]+')
+_QUOTED = _re.compile('"([^"]*)"')
 
-def parse(text):
-    return _Parse()(text)
-
-class _Parse:
-
-    @property
-    def quoting(self):
-        return bool(self.text[:self.index].count('"') % 2)
-
-    @staticmethod
-    def state(character):
-        if type(character) is not str:
-            raise TypeError
-        if len(character) != 1:
-            raise ValueError
-        if character == '"':
-            return 'quote'
-        if character in _str.whitespace:
-            return 'space'
-        return 'letter'
-
-    @property
-    def current_character(self):
-        return self.text[self.index]
-    @property
-    def previous_character(self):
-        if self.index == 0:
-            return ' '
-        return self.text[self.index - 1]
 
+class ParsingError(ValueError):
+    def __init__(self, message, *, offset):
+        super().__init__(f"At character {offset}: {message}")
+        self._offset = offset
     @property
-    def current_state(self):
-        return self.state(self.current_character)
-    @property
-    def previous_state(self):
-        return self.state(self.previous_character)
-
-    def __call__(self, text):
-        if text.count('"') % 2:
-            raise ValueError()
-        self.text = text
-        self.args = list()
-        for self.index in range(len(self.text)):
-            if self.run():
-                self.args[-1] += self.current_character
-        return self.args
-
+    def offset(self):
+        return self._offset
 
-    def run(self):
-        if self.current_state == 'quote':
-            return self.run_quote()
-        if self.current_state == 'space':
-            return self.run_space()
-        if self.current_state == 'letter':
-            return self.run_letter()
-        raise NotImplementedError
 
-    def run_space(self):
-        return self.quoting
-
-    def run_letter(self):
-        if self.quoting:
-            return True
-        if self.previous_state == 'space':
-            self.args.append("")
-            return True
-        if self.previous_state == 'letter':
-            return True
-        if self.previous_state == 'quote':
-            raise ValueError
-        raise NotImplementedError
-
-    def run_quote(self):
-        if self.quoting:
-            return False
-        if self.previous_state == 'space':
-            self.args.append("")
-            return False
-        if self.previous_state == 'letter':
-            raise ValueError
-        if self.previous_state == 'quote':
-            return True
-        raise NotImplementedError
- 
+def parse(text):
+    return list(tokenize(text))
+
+def tokenize(text):
+    """Yield the arguments within text one by one. 
+    
+    Arguments are separated by whitespace. 
+    Within double quotes whitespace is kept 
+    and two adjacent double quotes stand for one literal double quote. 
+    A quoted part must not touch unquoted letters. """
+    index = 0
+    while True:
+        index = _SPACE.match(text, index).end()
+        if index == len(text):
+            return
+        if text[index] == '"':
+            token, index = _quoted(text, index)
+        else:
+            match = _WORD.match(text, index)
+            token, index = match.group(), match.end()
+        if index < len(text) and text[index] not in _str.whitespace:
+            raise ParsingError("Quotes must be separated from letters by whitespace. ", offset=index)
+        yield token
+
+def _quoted(text, index):
+    parts = list()
+    while index < len(text) and text[index] == '"':
+        match = _QUOTED.match(text, index)
+        if match is None:
+            raise ParsingError("This quote is never closed. ", offset=index)
+        parts.append(match.group(1))
+        index = match.end()
+    return '"'.join(parts), index
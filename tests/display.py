@@ -0,0 +1,75 @@
+"""A Tk root on a virtual display for the GUI tests. """
+
+import contextlib
+import os
+import shutil
+import subprocess
+import time
+import unittest
+
+
+def _free_display():
+    for number in range(99, 200):
+        if not os.path.exists(f"/tmp/.X{number}-lock"):
+            return f":{number}"
+    raise RuntimeError("No free X display number was found. ")
+
+
+@contextlib.contextmanager
+def xvfb():
+    """Run an Xvfb server and yield its display, e.g. ':99'. """
+    display = _free_display()
+    server = subprocess.Popen(
+        ['Xvfb', display, '-screen', '0', '1280x1024x24'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        # the server creates its lock file once it accepts clients
+        for i in range(100):
+            if os.path.exists(f"/tmp/.X{display[1:]}-lock"):
+                break
+            time.sleep(0.05)
+        yield display
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def descendants(widget):
+    ans = list()
+    widgets = [widget]
+    while len(widgets):
+        widget = widgets.pop()
+        ans.append(widget)
+        widgets += widget.winfo_children()
+    return ans
+
+
+@unittest.skipIf(shutil.which('Xvfb') is None, "Xvfb is not installed")
+class TkTestCase(unittest.TestCase):
+    """Runs its tests with a Tk root (self.root) on a display of its own. """
+    @classmethod
+    def setUpClass(cls):
+        import tkinter
+        cls._display = xvfb()
+        try:
+            cls.root = tkinter.Tk(screenName=cls._display.__enter__())
+        except BaseException:
+            cls._display.__exit__(None, None, None)
+            raise
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            cls.root.destroy()
+        finally:
+            cls._display.__exit__(None, None, None)
+    def tearDown(self):
+        for child in self.root.winfo_children():
+            child.destroy()
+    def wait(self, milliseconds):
+        """Run the event loop for the given time. """
+        end = time.monotonic() + milliseconds / 1000
+        while time.monotonic() < end:
+            self.root.update()
+            time.sleep(0.01)
@@ -0,0 +1,107 @@
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+import types
+import unittest
+
+import lib_dzne_auto_interface as lib
+
+# bash-completion's lazy loader sources the script inside of a function
+_DRIVER = """
+load() { source "$1"; }
+load "$1"
+shift
+COMP_WORDS=("$@")
+COMP_CWORD=$((${#COMP_WORDS[@]} - 1))
+COMPREPLY=()
+_tool_complete
+printf '%s\\n' "${COMPREPLY[@]}"
+"""
+
+# words and CURRENT are plain variables outside of a completion widget,
+# and compadd and _files print what they would offer
+_ZSH_DRIVER = """
+compadd() { [[ $1 == -- ]] && shift; print -l -- "$@"; }
+_files() { print -l -- "files:$*"; }
+compdef() { }
+load() { source "$1"; }
+load "$1"
+shift
+words=("$@")
+CURRENT=${#words}
+_tool_complete
+"""
+
+
+def run(*, mode:{'choices':['fast', 'slow']}, n:int=0):
+    pass
+
+def stop(name, /):
+    pass
+
+
+@unittest.skipIf(shutil.which('bash') is None, "bash is not installed")
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestBash(unittest.TestCase):
+    def setUp(self):
+        tree = types.SimpleNamespace(_dest='command', run=run, stop=stop)
+        knot = lib.make(tree, return_details={})
+        self._directory = tempfile.mkdtemp()
+        self._script = os.path.join(self._directory, 'tool.bash')
+        with open(self._script, 'w') as stream:
+            stream.write(knot.completion('bash', prog='tool'))
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+    def complete(self, *words):
+        out = subprocess.run(
+            ['bash', '-c', _DRIVER, 'bash', self._script, 'tool', *words],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(out.stderr, "")
+        return sorted(out.stdout.split())
+    def test_commands(self):
+        self.assertEqual(self.complete(''), ['run', 'stop'])
+        self.assertEqual(self.complete('r'), ['run'])
+    def test_options(self):
+        self.assertIn('-mode', self.complete('run', '-'))
+    def test_choices(self):
+        self.assertEqual(self.complete('run', '-mode', ''), ['fast', 'slow'])
+
+
+@unittest.skipIf(shutil.which('zsh') is None, "zsh is not installed")
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestZsh(unittest.TestCase):
+    def setUp(self):
+        tree = types.SimpleNamespace(_dest='command', run=run, stop=stop)
+        knot = lib.make(tree, return_details={})
+        self._directory = tempfile.mkdtemp()
+        self._script = os.path.join(self._directory, 'tool.zsh')
+        with open(self._script, 'w') as stream:
+            stream.write(knot.completion('zsh', prog='tool'))
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+    def complete(self, *words):
+        out = subprocess.run(
+            ['zsh', '-f', '-c', _ZSH_DRIVER, 'zsh', self._script, 'tool', *words],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(out.stderr, "")
+        return sorted(out.stdout.split())
+    def test_commands(self):
+        self.assertEqual(self.complete(''), ['run', 'stop'])
+    def test_options(self):
+        self.assertIn('-mode', self.complete('run', '-'))
+    def test_choices(self):
+        self.assertEqual(self.complete('run', '-mode', ''), ['fast', 'slow'])
+    def test_positional(self):
+        self.assertEqual(self.complete('stop', ''), ['files:'])
+
+
+if __name__ == '__main__':
+    unittest.main()
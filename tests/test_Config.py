@@ -0,0 +1,30 @@
+import types
+import unittest
+
+import lib_dzne_auto_interface as lib
+from lib_dzne_auto_interface.Config import ConfigError
+
+
+def add(a:int, b:float, /, *, names:{'type':str, 'nargs':'*'}=[]):
+    return (a, b, names)
+
+
+class TestConvert(unittest.TestCase):
+    def setUp(self):
+        tree = types.SimpleNamespace(_dest='command', add=add)
+        self.knot = lib.make(tree, return_details={})
+    def run_config(self, **values):
+        return self.knot.run_config(dict(command='add', **values))
+    def test_strings(self):
+        self.assertEqual(self.run_config(a='2', b='2.5'), (2, 2.5, []))
+    def test_values(self):
+        self.assertEqual(self.run_config(a=2, b=2, names=['x']), (2, 2.0, ['x']))
+        self.assertIs(type(self.run_config(a=2, b=2)[1]), float)
+    def test_wrong_types(self):
+        for values in [dict(a=2.7, b=1.0), dict(a=True, b=1.0), dict(a=1, b=True), dict(a=1, b=1.0, names=[1])]:
+            with self.subTest(**values), self.assertRaises(ConfigError):
+                self.run_config(**values)
+
+
+if __name__ == '__main__':
+    unittest.main()
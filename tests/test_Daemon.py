@@ -0,0 +1,59 @@
+import io
+import multiprocessing.connection as mpc
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from lib_dzne_auto_interface import Client
+
+_SERVER = """
+import sys
+import types
+import lib_dzne_auto_interface as lib
+
+def echo(*words):
+    print(*words)
+
+tree = types.SimpleNamespace(_dest='command', echo=echo)
+lib.make(tree, return_details={}).serve(sys.argv[1])
+"""
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._directory, 'server.sock')
+        src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([src, os.environ.get('PYTHONPATH', '')]))
+        self._server = subprocess.Popen([sys.executable, '-c', _SERVER, self._path], env=env)
+        for i in range(100):
+            if os.path.exists(Client.key_path(self._path)) and os.path.exists(self._path):
+                break
+            time.sleep(0.05)
+    def tearDown(self):
+        self._server.kill()
+        self._server.wait()
+        shutil.rmtree(self._directory)
+    def test_run(self):
+        stdout = io.StringIO()
+        code = Client.client(self._path, ['echo', 'a', 'b'], stdout=stdout, stderr=io.StringIO())
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout.getvalue(), "a b\n")
+    def test_owner_only(self):
+        for file in (self._path, Client.key_path(self._path)):
+            self.assertEqual(stat.S_IMODE(os.stat(file).st_mode), 0o600)
+    def test_wrong_key(self):
+        with self.assertRaises(mpc.AuthenticationError):
+            mpc.Client(self._path, family='AF_UNIX', authkey=b"wrong")
+        # the server goes on serving
+        code = Client.client(self._path, ['echo'], stdout=io.StringIO(), stderr=io.StringIO())
+        self.assertEqual(code, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import lib_dzne_auto_interface as lib
+from lib_dzne_auto_interface import Isolation
+
+_parent = list() # filled in the parent only; a forked child sees it, a new interpreter does not
+
+
+def squares(n, /):
+    return (i * i for i in range(n))
+
+def forked():
+    return bool(len(_parent))
+
+def allocate(size, /):
+    return len(bytearray(size))
+
+
+def _in_thread(func, *args):
+    ans = dict()
+    def target():
+        try:
+            ans['value'] = func(*args)
+        except Exception as exc:
+            ans['error'] = exc
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if 'error' in ans.keys():
+        raise ans['error']
+    return ans['value']
+
+
+@unittest.skipIf(not hasattr(os, 'fork'), "os.fork is not available")
+class TestPolicy(unittest.TestCase):
+    def setUp(self):
+        _parent.append(None)
+        self.policy = Isolation.Policy(timeout=60)
+    def tearDown(self):
+        _parent.clear()
+    def test_iterator(self):
+        items = self.policy.call(squares, 4)
+        self.assertNotIsInstance(items, list)
+        self.assertEqual(list(items), [0, 1, 4, 9])
+    def test_fork(self):
+        self.assertEqual(threading.active_count(), 1)
+        self.assertTrue(self.policy.call(forked))
+    def test_threads(self):
+        # with another thread running the child is a new interpreter
+        self.assertFalse(_in_thread(self.policy.call, forked))
+        self.assertEqual(list(_in_thread(self.policy.call, squares, 3)), [0, 1, 4])
+        with self.assertRaises(TypeError):
+            _in_thread(self.policy.call, lambda: None)
+    def test_memory(self):
+        # the limit applies on top of the address space the child starts with
+        policy = Isolation.Policy(memory=200 << 20)
+        self.assertEqual(policy.call(allocate, 50 << 20), 50 << 20)
+        with self.assertRaises(MemoryError):
+            policy.call(allocate, 400 << 20)
+
+
+@unittest.skipIf(not hasattr(os, 'fork'), "os.fork is not available")
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestReturnFile(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        Isolation.enable(timeout=60)
+    def tearDown(self):
+        Isolation.disable()
+        shutil.rmtree(self._directory)
+    def test_streamed_in_child(self):
+        import lib_dzne_filedata as fd
+        def lines(n:int, /) -> fd.TXTData.File:
+            return (str(i) for i in range(n))
+        file = os.path.join(self._directory, 'lines.txt')
+        knot = lib.make(lines, return_details={'option_strings': ['-o']})
+        self.assertIsNone(knot.run_cli(['3', '-o', file]))
+        with open(file) as stream:
+            self.assertEqual(stream.read().split(), ['0', '1', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import io
+import sys
+import time
+import unittest
+
+from lib_dzne_auto_interface import Job
+
+
+def _count(n):
+    ans = 0
+    for i in range(n):
+        ans += i
+    return ans
+
+def _complain(text):
+    print(text, file=sys.stderr)
+
+def _spin():
+    while True:
+        pass
+
+
+class TestJob(unittest.TestCase):
+    def test_result(self):
+        job = Job.Job(_count, 1000).start()
+        self.assertTrue(job.wait(5))
+        self.assertIsNone(job.exception)
+        self.assertEqual(job.result, _count(1000))
+    def test_cancel(self):
+        job = Job.Job(_spin).start()
+        time.sleep(0.05)
+        job.cancel()
+        self.assertTrue(job.wait(5))
+        self.assertIsInstance(job.exception, Job.Cancelled)
+    def test_cancel_after_return(self):
+        job = Job.Job(_count, 10).start()
+        job.wait(5)
+        job.cancel()
+        self.assertIsNone(job.exception)
+        self.assertEqual(job.result, _count(10))
+    def test_streams_restored(self):
+        before = sys.stderr
+        log = io.StringIO()
+        job = Job.Job(_complain, "x", stderr=log).start()
+        job.wait(5)
+        self.assertEqual(log.getvalue(), "x\n")
+        self.assertIs(sys.stderr, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
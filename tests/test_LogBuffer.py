@@ -0,0 +1,34 @@
+import unittest
+
+from lib_dzne_auto_interface.LogBuffer import LogBuffer
+
+
+class TestLogBuffer(unittest.TestCase):
+    def test_lines(self):
+        buffer = LogBuffer(2)
+        buffer.write("a\nb")
+        buffer.write("c\nd\n")
+        self.assertEqual(buffer.read(0), (["bc", "d"], 3))
+        self.assertEqual(buffer.tail(5), ["bc", "d"])
+    def test_carriage_return(self):
+        buffer = LogBuffer()
+        for i in range(1000):
+            buffer.write(f"progress {i}\r")
+        self.assertEqual(buffer.read(0), ([], 0))
+        self.assertEqual(buffer.tail(1), ["progress 999"])
+        buffer.write("\n")
+        buffer.write("x\r\ny\rz\n")
+        self.assertEqual(buffer.read(0), (["progress 999", "x", "z"], 3))
+    def test_no_newline(self):
+        buffer = LogBuffer(100)
+        for i in range(100_000):
+            buffer.write("0123456789")
+        self.assertEqual(buffer.read(0), ([], 0))
+        partial = buffer.tail(1)[0]
+        self.assertEqual(len(partial), LogBuffer.max_line)
+        self.assertTrue(partial.endswith("0123456789"))
+        self.assertLessEqual(buffer._size, 2 * LogBuffer.max_line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+import lib_dzne_auto_interface as lib
+
+_MODULE = """
+_dest = 'command'
+
+def first(x, /):
+    return x
+"""
+
+
+def alpha(x, /):
+    return "alpha " + x
+
+def beta(x, /):
+    return "beta " + x
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._cache = os.path.join(self._directory, 'cache')
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+    def test_instances_are_not_cached(self):
+        for name, func in [('alpha', alpha), ('beta', beta)]:
+            tree = types.SimpleNamespace(_dest='command', **{name: func})
+            knot = lib.make(tree, return_details={}, cache=self._cache)
+            self.assertEqual(knot.names, [name])
+            self.assertEqual(knot.run_dictionary(knot.parse([name, "x"])), f"{name} x")
+    def test_module(self):
+        with open(os.path.join(self._directory, '_manifest_module.py'), 'w') as stream:
+            stream.write(_MODULE)
+        sys.path.insert(0, self._directory)
+        try:
+            import _manifest_module as module
+            for i in range(2):
+                knot = lib.make(module, return_details={}, cache=self._cache)
+                self.assertEqual(knot.names, ['first'])
+                self.assertEqual(knot.parse(['first', 'x']), {'command': 'first', 'x': 'x'})
+            self.assertTrue(os.path.exists(os.path.join(self._cache, '_manifest_module', 'first.manifest.pickle')))
+        finally:
+            sys.path.remove(self._directory)
+            sys.modules.pop('_manifest_module', None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from lib_dzne_auto_interface import ResultCache
+
+
+class _Outfile(object):
+    # restore and store only need the path and the extension of a File
+    ext = '.txt'
+    def __init__(self, path):
+        self._path = path
+    def __str__(self):
+        return self._path
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._umask = os.umask(0o022)
+    def tearDown(self):
+        os.umask(self._umask)
+        shutil.rmtree(self._directory)
+    def _store(self, **kwargs):
+        return ResultCache.Store(os.path.join(self._directory, 'cache'), **kwargs)
+    def _write(self, name, text):
+        path = os.path.join(self._directory, name + '.txt')
+        with open(path, 'w') as stream:
+            stream.write(text)
+        return _Outfile(path)
+    def _read(self, outfile):
+        with open(str(outfile)) as stream:
+            return stream.read()
+    def test_copy(self):
+        store = self._store()
+        store.store('k' * 64, self._write('a', "text\n"))
+        outfile = _Outfile(os.path.join(self._directory, 'b.txt'))
+        self.assertTrue(store.restore('k' * 64, outfile))
+        self.assertEqual(self._read(outfile), "text\n")
+        self.assertEqual(stat.S_IMODE(os.stat(str(outfile)).st_mode), 0o644)
+        with open(str(outfile), 'a') as stream:
+            stream.write("edited\n")
+        again = _Outfile(os.path.join(self._directory, 'c.txt'))
+        self.assertTrue(store.restore('k' * 64, again))
+        self.assertEqual(self._read(again), "text\n")
+    def test_link(self):
+        store = self._store(link=True)
+        store.store('k' * 64, self._write('a', "text\n"))
+        outfile = _Outfile(os.path.join(self._directory, 'b.txt'))
+        self.assertTrue(store.restore('k' * 64, outfile))
+        with open(str(outfile), 'a') as stream:
+            stream.write("edited\n")
+        # the edited entry is dropped instead of restored
+        self.assertFalse(store.restore('k' * 64, _Outfile(os.path.join(self._directory, 'c.txt'))))
+        self.assertEqual(self._read(outfile), "text\nedited\n")
+        self.assertEqual(store.stats()['entries'], 0)
+    def test_no_overwrite(self):
+        store = self._store()
+        store.store('k' * 64, self._write('a', "text\n"))
+        outfile = self._write('b', "mine\n")
+        with self.assertRaises(FileExistsError):
+            store.restore('k' * 64, outfile)
+        self.assertEqual(self._read(outfile), "mine\n")
+    def test_evict(self):
+        store = self._store(max_bytes=10)
+        for i in range(4):
+            store.store(str(i) * 64, self._write(str(i), "four"))
+        self.assertTrue(store.restore('2' * 64, _Outfile(os.path.join(self._directory, 'x.txt'))))
+        store.store('4' * 64, self._write('4', "four"))
+        stats = store.stats()
+        self.assertEqual((stats['entries'], stats['bytes'], stats['evictions']), (2, 8, 3))
+        self.assertEqual((stats['hits'], stats['misses']), (1, 0))
+        # the entry used last survives
+        self.assertTrue(store.restore('2' * 64, _Outfile(os.path.join(self._directory, 'y.txt'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
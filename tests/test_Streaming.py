@@ -0,0 +1,53 @@
+import importlib.util
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+import lib_dzne_auto_interface as lib
+
+
+def _mode(file):
+    return stat.S_IMODE(os.stat(file).st_mode)
+
+
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        import lib_dzne_filedata as fd
+        self._directory = tempfile.mkdtemp()
+        def generated(n:int, /) -> fd.TXTData.File:
+            return (str(i) for i in range(n))
+        def listed(n:int, /) -> fd.TXTData.File:
+            return [str(i) for i in range(n)]
+        def racing(n:int, /) -> fd.TXTData.File:
+            for i in range(n):
+                if i == 1:
+                    with open(self._file('racing'), 'w') as stream:
+                        stream.write("theirs\n")
+                yield str(i)
+        self._funcs = {'generated': generated, 'listed': listed, 'racing': racing}
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+    def _file(self, name):
+        return os.path.join(self._directory, name + '.txt')
+    def _run(self, name):
+        knot = lib.make(self._funcs[name], return_details={'option_strings': ['-o']})
+        knot.run_cli(['3', '-o', self._file(name)])
+    def test_mode(self):
+        self._run('generated')
+        self._run('listed')
+        with open(self._file('generated')) as stream:
+            self.assertEqual(stream.read().split(), ['0', '1', '2'])
+        self.assertEqual(_mode(self._file('generated')), _mode(self._file('listed')))
+    def test_no_overwrite(self):
+        with self.assertRaises(FileExistsError):
+            self._run('racing')
+        with open(self._file('racing')) as stream:
+            self.assertEqual(stream.read(), "theirs\n")
+        self.assertEqual(os.listdir(self._directory), ['racing.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import threading
+import unittest
+
+from lib_dzne_auto_interface import Timing
+
+
+class TestRecorder(unittest.TestCase):
+    def test_concurrent_runs(self):
+        recorders = dict()
+        entered = threading.Barrier(2)
+        def run(name, count):
+            with Timing.Recorder() as recorder:
+                entered.wait()
+                for i in range(count):
+                    with Timing.phase('call'):
+                        pass
+            recorders[name] = recorder
+        threads = [threading.Thread(target=run, args=(x, n)) for x, n in [('a', 3), ('b', 5)]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(recorders['a'].counts, {'call': 3})
+        self.assertEqual(recorders['b'].counts, {'call': 5})
+    def test_hooks(self):
+        seen = list()
+        hook = lambda phase, seconds: seen.append(phase)
+        Timing.add_hook(hook)
+        try:
+            # hooks see the phases of every thread
+            thread = threading.Thread(target=self._parse)
+            thread.start()
+            thread.join()
+        finally:
+            Timing.remove_hook(hook)
+        self._parse()
+        self.assertEqual(seen, ['parse'])
+    @staticmethod
+    def _parse():
+        with Timing.phase('parse'):
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import importlib.util
+import sys
+import time
+import types
+import unittest
+
+import lib_dzne_auto_interface as lib
+
+from display import TkTestCase, descendants
+
+
+def many(x:{'nargs':100, 'type':int}, /):
+    return x
+
+def command(x, /):
+    return x
+
+def work(lines, error=None):
+    for i in range(lines):
+        print(f"line {i}", file=sys.stderr)
+    if error is not None:
+        raise error
+
+
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestVirtualStack(TkTestCase):
+    def setUp(self):
+        import lib_dzne_auto_interface.gui.frames as frames
+        import lib_dzne_auto_interface.gui.Stack as Stack
+        self.frame = lib.make(many, return_details={}).frame(self.root)
+        self.frame.pack()
+        self.root.update()
+        widgets = descendants(self.frame)
+        self.argumentFrame, = [x for x in widgets if isinstance(x, frames.ArgumentFrame)]
+        self.stack, = [x for x in widgets if isinstance(x, Stack.VirtualStack)]
+    def texts(self):
+        import tkinter as tk
+        return [x for x in descendants(self.stack) if isinstance(x, tk.Text)]
+    def test_rows_scrolled_into_view(self):
+        import tkinter.ttk as ttk
+        # the rows in view now are created after the validation tag was added
+        self.stack.yview('moveto', 1.0)
+        self.root.update()
+        text = self.texts()[0]
+        text.insert('1.0', "not a number")
+        # key events go to the window with the focus
+        text.focus_force()
+        self.root.update()
+        text.event_generate('<KeyRelease>')
+        self.wait(self.argumentFrame.validation_delay + 200)
+        shown = [
+            x.cget('text') for x in descendants(self.argumentFrame)
+            if isinstance(x, ttk.Label) and (x.winfo_manager() == 'pack')
+        ]
+        self.assertTrue(any("invalid int value" in x for x in shown))
+    def test_state_survives_scrolling(self):
+        self.stack.yview('moveto', 0.0)
+        self.root.update()
+        for text in self.texts():
+            text.insert('1.0', "7")
+        before = [x.get_args() for x in self.stack.levels]
+        self.assertIn('7', before[0])
+        self.stack.yview('moveto', 1.0)
+        self.root.update()
+        self.assertEqual([x.get_args() for x in self.stack.levels], before)
+        self.stack.yview('moveto', 0.0)
+        self.root.update()
+        self.assertEqual([x.get_args() for x in self.stack.levels], before)
+
+
+class TestJobQueue(TkTestCase):
+    def setUp(self):
+        from lib_dzne_auto_interface.gui.JobQueue import JobQueue
+        self.queue = JobQueue(self.root)
+        self.queue.poll_interval = 10
+        # the dialog would wait for a user
+        self.queue.report_failures = False
+        self.queue.pack()
+    def settle(self):
+        end = time.monotonic() + 10
+        while self.queue.busy and (time.monotonic() < end):
+            self.wait(20)
+        self.wait(100)
+    def test_log(self):
+        row = self.queue.submit(work, 50, ValueError("bad input"))
+        self.queue.tree.selection_set(row)
+        self.settle()
+        self.assertEqual(self.queue.tree.item(row)['values'][0], 'failed')
+        lines = self.queue.logText.get('1.0', 'end-1c').splitlines()
+        self.assertEqual(lines, [f"line {i}" for i in range(50)] + ["ValueError: bad input"])
+
+
+@unittest.skipIf(importlib.util.find_spec('lib_dzne_filedata') is None, "lib_dzne_filedata is not installed")
+class TestUncallableFrame(TkTestCase):
+    def test_tabs_with_jobs_are_kept(self):
+        tree = types.SimpleNamespace(_dest='command', **{f"c{i}": command for i in range(4)})
+        frame = lib.make(tree, return_details={}).frame(self.root)
+        frame.max_tabs = 1
+        frame.pack()
+        queue = frame.materialize('c0').queue
+        queue.submit(work, 1)
+        while queue.busy:
+            self.wait(20)
+        for name in ['c1', 'c2', 'c3']:
+            frame.materialize(name)
+        # the finished job keeps its tab, and with it the queue
+        self.assertIs(frame.materialize('c0').queue, queue)
+        self.assertEqual(len(queue.rows), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()